@@ -0,0 +1,36 @@
+'''
+Compares building a graph through Graph.add_edges, one edge per call, with
+the single-pass Graph.from_edges loader.
+
+    python benchmarks/bench_bulk_load.py [number of edges]
+'''
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import timeit
+import src.graphex as gx
+from generators import random_edges
+
+
+def load_with_add_edges(edges, weighted):
+    G = gx.Graph(weighted=weighted)
+    for edge in edges:
+        G.add_edges(edge)
+    return G
+
+
+def load_with_from_edges(edges, weighted):
+    return gx.Graph.from_edges(edges, weighted=weighted)
+
+
+def main(num_edges=200000, repeat=3):
+    for weighted in (False, True):
+        edges = random_edges(num_edges, num_edges // 4, weighted=weighted)
+
+        for name, loader in (('add_edges', load_with_add_edges), ('from_edges', load_with_from_edges)):
+            best = min(timeit.repeat(lambda: loader(edges, weighted), number=1, repeat=repeat))
+            print('{:>10} | weighted={!s:<5} | {} edges | {:.3f}s'.format(name, weighted, num_edges, best))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,176 @@
+'''
+Times the main Graph operations on generated random, grid, scale-free and
+path graphs, writes the results to a JSON report and, given the report of
+an earlier run, flags every operation that got slower than a threshold.
+
+    python benchmarks/bench_suite.py --output report.json
+    python benchmarks/bench_suite.py --baseline report.json --threshold 0.25
+
+The exit status is 1 when there is any regression, so the comparison can
+run on every commit. Searches look for a node that is not in the graph, so
+they always traverse everything reachable from their start. Only the best
+of the repeated runs is kept, as it is the least affected by other load.
+'''
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import platform
+import random
+import time
+import src.graphex as gx
+from generators import GENERATORS
+
+
+MISSING = -1              # Search goal that is never found
+SAMPLE_SIZE = 10000       # Lookups timed by get_weight
+REMOVED_FRACTION = 0.01   # Share of the nodes timed by remove_nodes
+
+
+def _add_edges(edges, G):
+    def run():
+        gx.Graph(weighted=True).add_edges(edges)
+    return run
+
+
+def _remove_nodes(edges, G):
+    # The removal gets a graph of its own, built before the timer starts
+    H = gx.Graph.from_edges(edges, weighted=True)
+    nodes = H.get_nodes()
+    nodes = random.Random(0).sample(nodes, max(1, int(len(nodes) * REMOVED_FRACTION)))
+
+    def run():
+        H.remove_nodes(nodes)
+    return run
+
+
+def _get_weight(edges, G):
+    sample = [(u, v) for u, v, _ in random.Random(0).choices(edges, k=SAMPLE_SIZE)]
+
+    def run():
+        get_weight = G.get_weight
+        for edge in sample:
+            get_weight(edge)
+    return run
+
+
+def _search(name):
+    def prepare(edges, G):
+        search = getattr(G, name)
+        start = edges[0][0]
+
+        def run():
+            search(MISSING, start=start)
+        return run
+    return prepare
+
+
+OPERATIONS = {
+    'add_edges': _add_edges,
+    'remove_nodes': _remove_nodes,
+    'get_weight': _get_weight,
+    'breadth_first_search': _search('breadth_first_search'),
+    'depth_first_search': _search('depth_first_search'),
+    'uniform_cost_search': _search('uniform_cost_search'),
+}
+
+
+def measure(prepare, edges, G, repeat) -> float:
+    '''
+    Best time, in seconds, of 'repeat' runs, each prepared from scratch
+    '''
+    best = float('inf')
+
+    for _ in range(repeat):
+        run = prepare(edges, G)
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+
+    return best
+
+
+def run_suite(sizes, graphs, operations, repeat) -> list:
+    results = []
+
+    for graph in graphs:
+        for size in sizes:
+            edges = GENERATORS[graph](size, weighted=True)
+            # Read-only operations share one graph
+            G = gx.Graph.from_edges(edges, weighted=True)
+
+            for operation in operations:
+                seconds = measure(OPERATIONS[operation], edges, G, repeat)
+                results.append({'graph': graph, 'edges': size, 'operation': operation, 'seconds': seconds})
+                print('{:>10} | {:>8} edges | {:<20} | {:.6f}s'.format(graph, size, operation, seconds), flush=True)
+
+    return results
+
+
+def compare(results, baseline, threshold) -> list:
+    '''
+    Returns the results more than 'threshold' (0.25 meaning 25%) slower
+    than the same graph, size and operation in the baseline results
+    '''
+    previous = {(r['graph'], r['edges'], r['operation']): r['seconds'] for r in baseline}
+    regressions = []
+
+    for result in results:
+        before = previous.get((result['graph'], result['edges'], result['operation']))
+        if before and result['seconds'] > before * (1 + threshold):
+            regressions.append(dict(result, baseline=before, ratio=result['seconds'] / before))
+
+    return regressions
+
+
+def _names(value, choices) -> list:
+    names = value.split(',')
+    for name in names:
+        if name not in choices:
+            raise argparse.ArgumentTypeError('{!r} is not one of {}'.format(name, ', '.join(choices)))
+    return names
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmarks the Graph operations on generated graphs')
+    parser.add_argument('--sizes', default='1000,10000,100000',
+                        type=lambda value: [int(float(size)) for size in value.split(',')],
+                        help='comma separated edge counts, such as 1e3,1e6 (default: %(default)s)')
+    parser.add_argument('--graphs', default=','.join(GENERATORS), type=lambda value: _names(value, GENERATORS))
+    parser.add_argument('--operations', default=','.join(OPERATIONS), type=lambda value: _names(value, OPERATIONS))
+    parser.add_argument('--repeat', default=3, type=int)
+    parser.add_argument('--output', help='path of the JSON report to write')
+    parser.add_argument('--baseline', help='JSON report of an earlier run to compare against')
+    parser.add_argument('--threshold', default=0.25, type=float,
+                        help='slowdown reported as a regression, 0.25 meaning 25%% (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.graphs, args.operations, args.repeat)
+
+    if args.output:
+        report = {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'results': results,
+        }
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as file:
+        regressions = compare(results, json.load(file)['results'], args.threshold)
+
+    for r in regressions:
+        print('REGRESSION {} | {} edges | {}: {:.6f}s against {:.6f}s ({:+.0%})'.format(
+            r['graph'], r['edges'], r['operation'], r['seconds'], r['baseline'], r['ratio'] - 1))
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,74 @@
+'''
+Seeded graph generators for the benchmarks. Each returns a list of about
+'num_edges' edges between integer nodes, as (u, v, w) triples when
+'weighted', or (u, v) pairs otherwise.
+'''
+import math
+import random
+
+
+def _edge(rng, u, v, weighted):
+    return (u, v, rng.randint(1, 100)) if weighted else (u, v)
+
+
+def random_edges(num_edges, num_nodes=None, weighted=False, seed=0):
+    # Endpoints drawn uniformly, four edges per node by default
+    rng = random.Random(seed)
+    num_nodes = num_nodes or max(2, num_edges // 4)
+
+    return [_edge(rng, rng.randrange(num_nodes), rng.randrange(num_nodes), weighted) for _ in range(num_edges)]
+
+
+def grid_edges(num_edges, weighted=False, seed=0):
+    # Square lattice, each node joined to its right and lower neighbors
+    rng = random.Random(seed)
+    side = int(math.sqrt(num_edges / 2)) + 1
+    edges = []
+
+    for row in range(side):
+        for column in range(side):
+            node = row * side + column
+            if column + 1 < side:
+                edges.append(_edge(rng, node, node + 1, weighted))
+            if row + 1 < side:
+                edges.append(_edge(rng, node, node + side, weighted))
+
+    return edges[:num_edges]
+
+
+def scale_free_edges(num_edges, m=4, weighted=False, seed=0):
+    '''
+    Barabási–Albert preferential attachment: each new node links to 'm'
+    distinct nodes picked with probability proportional to their degree
+    '''
+    rng = random.Random(seed)
+    # Every node appears here once per incident edge
+    endpoints = list(range(m))
+    edges = []
+    node = m
+
+    while len(edges) < num_edges:
+        targets = set()
+        while len(targets) < m:
+            targets.add(rng.choice(endpoints))
+
+        for target in targets:
+            edges.append(_edge(rng, node, target, weighted))
+            endpoints.extend((node, target))
+        node += 1
+
+    return edges[:num_edges]
+
+
+def path_edges(num_edges, weighted=False, seed=0):
+    rng = random.Random(seed)
+
+    return [_edge(rng, i, i + 1, weighted) for i in range(num_edges)]
+
+
+GENERATORS = {
+    'random': random_edges,
+    'grid': grid_edges,
+    'scale_free': scale_free_edges,
+    'path': path_edges,
+}
@@ -0,0 +1,57 @@
+'''
+Drivers running searches from asyncio code, see BaseGraph.abfs and
+BaseGraph.adijkstra.
+
+Searches run on the event loop thread as the same generators used by the
+synchronous methods, giving control back to the loop after every
+'yield_every' expanded nodes, so other tasks keep running during a long
+search. At those points the search may be cancelled like any task (for
+instance by asyncio.wait_for), it raises asyncio.TimeoutError once the loop's
+clock reaches 'deadline', and it raises RuntimeError if the graph was changed
+in the meantime, as its arrays no longer match the graph. With an
+'executor', the synchronous search runs there instead and the coroutine only
+waits for it; the search itself cannot be interrupted then, so a cancelled or
+late search finishes in the background. Thread executors must only be given
+graphs that no other thread changes, such as a FrozenGraph or a
+ConcurrentGraph snapshot.
+'''
+import asyncio
+
+
+async def drive(graph, steps, deadline, finish=None):
+    '''
+    Runs the search generator 'steps' to its end, pausing on the event loop
+    whenever it yields. Returns its result, passed through 'finish' if given
+    '''
+    loop = asyncio.get_event_loop()
+    version = graph._version
+
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            result = stop.value
+            break
+
+        await asyncio.sleep(0)
+
+        if graph._version != version:
+            raise RuntimeError('Graph changed during the search')
+        if deadline is not None and loop.time() >= deadline:
+            raise asyncio.TimeoutError('Search deadline exceeded')
+
+    return result if finish is None else finish(result)
+
+
+async def done(result):
+    # Coroutine for a result known in advance, such as a cached one
+    return result
+
+
+async def offload(executor, deadline, func):
+    loop = asyncio.get_event_loop()
+    future = loop.run_in_executor(executor, func)
+    if deadline is None:
+        return await future
+
+    return await asyncio.wait_for(future, max(0, deadline - loop.time()))
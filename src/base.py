@@ -0,0 +1,1128 @@
+import functools
+import heapq
+from array import array
+from collections import deque
+
+from . import cache, linalg, stats
+from .cache import QueryCache, cached_query
+from .edgelist import write_edgelist
+from .structures import IndexedHeap, UnionFind
+
+
+INFINITY = float('inf')
+
+
+class BaseGraph():
+    '''
+    Read-only queries shared by every graph representation. Subclasses store
+    nodes under dense integer ids (keys) and expose them through the hooks
+    below, so searches keep their state in flat arrays indexed by id. The
+    public methods always accept and return the original node labels
+    '''
+
+    _weighted = False
+    _directed = False
+
+    # Bumped by every change to the graph, so cached results are never stale
+    _version = 0
+    _cache = None
+    _connectivity = None
+
+    # Instrumentation, see enable_stats. Searches take their heap push from
+    # the instance so it can be counted, and hand their frontier to the probe
+    _stats = None
+    _probe = None
+    _heappush = staticmethod(heapq.heappush)
+    _instrumented_searches = ('breadth_first_search', 'depth_first_search', 'bidirectional_search', 'bidirectional_dijkstra',
+                              'a_star', 'dijkstra', 'uniform_cost_search', 'shortest_paths_many', 'nearest_source',
+                              'abfs', 'adijkstra')
+    _instrumented_mutations = ()
+
+
+    # Storage hooks, implemented by each representation
+
+    def _node_count(self) -> int:
+        raise NotImplementedError
+
+
+    def _node_keys(self):
+        raise NotImplementedError
+
+
+    def _capacity(self) -> int:
+        # Upper bound on the ids in use, sizing the arrays of the searches
+        raise NotImplementedError
+
+
+    def _key(self, node):
+        raise NotImplementedError
+
+
+    def _label(self, key):
+        raise NotImplementedError
+
+
+    def _successors(self, key):
+        raise NotImplementedError
+
+
+    def _weighted_successors(self, key):
+        raise NotImplementedError
+
+
+    def _weighted_predecessors(self, key):
+        raise NotImplementedError
+
+
+    def _has_edges(self) -> bool:
+        raise NotImplementedError
+
+
+    # Basic queries
+
+    def get_nodes(self) -> list:
+        return [self._label(key) for key in self._node_keys()]
+
+
+    def get_edges(self) -> list:
+        edges = []
+
+        for key in self._node_keys():
+            u = self._label(key)
+            for v in self._successors(key):
+                edges.append((u, self._label(v)))
+
+        return edges
+
+
+    def get_adjacency_list(self, node) -> list:
+        key = self._key(node)
+        return [(self._label(v), w) for v, w in self._weighted_successors(key)]
+
+
+    def get_weight(self, edge: tuple):
+        u, v = edge
+
+        for node, weight in self.get_adjacency_list(u):
+            if node == v:
+                return weight
+
+        raise KeyError('Edge {} is not in the graph'.format((u, v)))
+
+
+    def has_edge(self, edge: tuple) -> bool:
+        try:
+            self.get_weight(edge)
+        except KeyError:
+            return False
+        return True
+
+
+    def predecessors(self, node) -> list:
+        key = self._key(node)
+        return [self._label(u) for u, _ in self._weighted_predecessors(key)]
+
+
+    def in_degree(self, node) -> int:
+        key = self._key(node)
+        return sum(1 for _ in self._weighted_predecessors(key))
+
+
+    # Views, see src/views.py
+
+    def subgraph(self, nodes):
+        '''
+        Returns a read-only view of the nodes in 'nodes' and the edges between
+        them, which shares this graph's storage instead of copying it
+        '''
+        from .views import SubgraphView
+        return SubgraphView(self, nodes)
+
+
+    def edge_filtered(self, predicate):
+        '''
+        Returns a read-only view of the edges (u, v) of weight w for which
+        predicate(u, v, w) holds, filtered as the view is searched
+        '''
+        from .views import EdgeFilteredView
+        return EdgeFilteredView(self, predicate)
+
+
+    def reverse(self):
+        '''
+        Returns a read-only view with the direction of every edge reversed
+        '''
+        from .views import ReverseView
+        return ReverseView(self)
+
+
+    # Connectivity
+
+    def is_connected(self, u, v) -> bool:
+        '''
+        Whether 'u' and 'v' are in the same connected component, ignoring
+        edge directions. Answered by a union-find structure that is built on
+        the first call and then kept up to date as edges are added
+        '''
+        u, v = self._key(u), self._key(v)
+
+        if self._connectivity is None:
+            self._connectivity = _ConnectivityIndex(self)
+        return self._connectivity.connected(u, v)
+
+
+    def connected_components(self) -> list:
+        '''
+        Lists the nodes of every connected component, ignoring edge
+        directions, so directed graphs get their weakly connected components
+        '''
+        if self._connectivity is None:
+            self._connectivity = _ConnectivityIndex(self)
+        union_find = self._connectivity.union_find()
+
+        components = {}
+        for key in self._node_keys():
+            components.setdefault(union_find.find(key), []).append(self._label(key))
+
+        return list(components.values())
+
+
+    def strongly_connected_components(self) -> list:
+        '''
+        Lists the nodes of every strongly connected component, using Tarjan's
+        algorithm with an explicit stack instead of recursion, so that deep
+        graphs never reach Python's recursion limit. Components are listed
+        in reverse topological order
+        '''
+        successors = self._successors
+        label = self._label
+
+        capacity = self._capacity()
+        index = array('q', [-1]) * capacity
+        low = array('q', [0]) * capacity
+        on_stack = bytearray(capacity)
+        stack = []
+        components = []
+        counter = 0
+
+        for root in self._node_keys():
+            if index[root] >= 0:
+                continue
+
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            # Each frame holds a node and the iterator over its remaining neighbors
+            frames = [(root, iter(successors(root)))]
+
+            while frames:
+                node, neighbors = frames[-1]
+
+                for neighbor in neighbors:
+                    if index[neighbor] < 0:
+                        index[neighbor] = low[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack[neighbor] = 1
+                        frames.append((neighbor, iter(successors(neighbor))))
+                        break
+                    elif on_stack[neighbor] and index[neighbor] < low[node]:
+                        low[node] = index[neighbor]
+                else:
+                    frames.pop()
+                    if frames:
+                        parent = frames[-1][0]
+                        if low[node] < low[parent]:
+                            low[parent] = low[node]
+
+                    if low[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = 0
+                            component.append(label(member))
+                            if member == node:
+                                break
+                        components.append(component)
+
+        return components
+
+
+    # Spanning trees
+
+    def minimum_spanning_tree(self, method='kruskal') -> list:
+        '''
+        Edges (u, v, w) of a minimum spanning tree, or of a minimum spanning
+        forest when the graph is not connected. 'kruskal' sorts every edge
+        and joins components with union-find, 'prim' grows each tree from a
+        node using an IndexedHeap with decrease-key. The edges can be loaded
+        with Graph.from_edges(edges, weighted=True)
+        '''
+        if self._directed:
+            raise TypeError('Minimum spanning trees are only defined for undirected graphs')
+
+        if method == 'kruskal':
+            keys = self._kruskal()
+        elif method == 'prim':
+            keys = self._prim()
+        else:
+            raise ValueError("Method must be 'kruskal' or 'prim', got {!r}".format(method))
+
+        label = self._label
+        return [(label(u), label(v), w) for u, v, w in keys]
+
+
+    def _kruskal(self) -> list:
+        # Each undirected edge is stored twice, only (u, v) with u <= v is kept
+        edges = [(w, u, v) for u in self._node_keys() for v, w in self._weighted_successors(u) if u < v]
+        edges.sort(key=lambda edge: edge[0])
+
+        union_find = UnionFind(self._capacity())
+        tree = []
+        for w, u, v in edges:
+            if union_find.union(u, v):
+                tree.append((u, v, w))
+
+        return tree
+
+
+    def _prim(self) -> list:
+        weighted_successors = self._weighted_successors
+        capacity = self._capacity()
+        in_tree = bytearray(capacity)
+        parents = array('q', [-1]) * capacity
+        tree = []
+
+        for root in self._node_keys():
+            if in_tree[root]:
+                continue
+
+            heap = IndexedHeap()
+            heap.push(root, 0)
+
+            while heap:
+                node, weight = heap.pop()
+                in_tree[node] = 1
+                if node != root:
+                    tree.append((parents[node], node, weight))
+
+                for neighbor, weight in weighted_successors(node):
+                    if not in_tree[neighbor] and heap.push(neighbor, weight):
+                        parents[neighbor] = node
+
+        return tree
+
+
+    # Query cache
+
+    def enable_cache(self, maxsize=128) -> None:
+        '''
+        Keeps the results of the last 'maxsize' distinct searches. Any change
+        to the graph invalidates every cached result
+        '''
+        self._cache = QueryCache(maxsize)
+
+
+    def disable_cache(self) -> None:
+        self._cache = None
+
+
+    def cache_info(self):
+        '''
+        Returns (hits, misses, evictions, size, maxsize), or None when the
+        cache is disabled
+        '''
+        return None if self._cache is None else self._cache.info()
+
+
+    # Instrumentation
+
+    def enable_stats(self, callback=None) -> None:
+        '''
+        Records counters and wall time for every search and mutation, see
+        src/stats.py. 'callback' receives the CallStats of each call, such as
+        to export them. Graphs without stats pay nothing for this
+        '''
+        self._stats = stats.Stats(callback)
+        stats.enable(self, self._stats)
+
+
+    def disable_stats(self) -> None:
+        stats.disable(self)
+        self._stats = None
+
+
+    def get_stats(self):
+        '''
+        Returns the Stats collecting the counters, or None when disabled
+        '''
+        return self._stats
+
+
+    def write_edgelist(self, path, delimiter=' ') -> None:
+        '''
+        Writes one edge per line, as "u v" or "u v w", compressing the file
+        with gzip when 'path' ends in .gz. See Graph.read_edgelist
+        '''
+        write_edgelist(self, path, delimiter)
+
+
+    # Matrices, which need numpy (and scipy for sparse matrices)
+
+    def to_numpy_matrix(self, nonedge=0.0, dtype=float):
+        '''
+        Returns the dense adjacency matrix of edge weights (ones when the graph
+        is unweighted), with rows and columns in the order of get_nodes()
+        '''
+        return linalg.to_numpy_matrix(self, nonedge=nonedge, dtype=dtype)
+
+
+    def to_scipy_sparse(self, format='csr'):
+        '''
+        Returns the adjacency matrix as a SciPy sparse matrix in 'format', such
+        as 'csr' or 'coo', with rows and columns in the order of get_nodes()
+        '''
+        return linalg.to_scipy_sparse(self, format=format)
+
+
+    def degree_vector(self, direction='out', weighted=False):
+        '''
+        Returns a NumPy array with the 'out' or 'in' degree of every node, or
+        the total weight of those edges when 'weighted' is set
+        '''
+        return linalg.degree_vector(self, direction=direction, weighted=weighted)
+
+
+    def pagerank(self, alpha=0.85, tol=1e-10, max_iter=100, weighted=True) -> dict:
+        '''
+        Returns the PageRank of every node, with damping factor 'alpha', by
+        power iteration until the scores change by less than 'tol' per node
+        '''
+        return linalg.pagerank(self, alpha=alpha, tol=tol, max_iter=max_iter, weighted=weighted)
+
+
+    def all_pairs_shortest_paths(self, method='auto', next_hops=False):
+        '''
+        Returns the NumPy matrix of distances between every pair of nodes, in
+        the order of get_nodes(), with infinity when unreachable. The
+        'floyd_warshall' method suits dense graphs and negative weights, and
+        'dijkstra' (one run per node) sparse graphs; 'auto' picks by density.
+        With 'next_hops', also returns the matrix of the index of the next node
+        on a shortest path from i to j (-1 if none), so the path is i,
+        next_hops[i, j], next_hops[next_hops[i, j], j], ... up to j
+        '''
+        return linalg.all_pairs_shortest_paths(self, method=method, next_hops=next_hops)
+
+
+    # Searches
+
+    @staticmethod
+    def build_path(predecessors, node) -> list:
+        if node not in predecessors:
+            return []
+
+        path = []
+        while node is not None:
+            path.append(node)
+            node = predecessors[node]
+        path.reverse()
+
+        return path
+
+
+    def _check_search(self, start):
+        if self._node_count() == 0:
+            raise KeyError('Graph has no nodes')
+
+        if not self._has_edges():
+            raise KeyError('Graph has no edges')
+
+        # Searches start from the first node added when no start is given
+        if start is None:
+            return next(iter(self._node_keys()))
+
+        return self._key(start)
+
+
+    def _goal_key(self, goal):
+        # An inexistent goal is simply never found
+        try:
+            return self._key(goal)
+        except KeyError:
+            return None
+
+
+    def _key_path(self, parents, key) -> list:
+        # The start of a search is its own parent
+        path = [self._label(key)]
+        while parents[key] != key:
+            key = parents[key]
+            path.append(self._label(key))
+        path.reverse()
+
+        return path
+
+
+    @cached_query
+    def breadth_first_search(self, goal, start=None, get_path=True):
+        return _run(self._breadth_first_search(goal, start, get_path))
+
+
+    def _breadth_first_search(self, goal, start, get_path, pause_every=0):
+        '''
+        Checks the arguments and binds the storage hooks right away, then
+        returns the search as a generator, which pauses (yields) after every
+        'pause_every' expanded nodes, or never when 0, and returns the result
+        of breadth_first_search
+        '''
+        start = self._check_search(start)
+        goal = self._goal_key(goal)
+
+        # Parents double as the visited flags, -1 meaning not yet discovered
+        parents = array('q', [-1]) * self._capacity()
+        parents[start] = start
+        queue = deque([start])
+
+        if self._probe is not None:
+            self._probe.watch(queue)
+
+        return self._breadth_first_steps(self._successors, parents, queue, start, goal, get_path, pause_every)
+
+
+    def _breadth_first_steps(self, successors, parents, queue, start, goal, get_path, pause_every):
+        found = start == goal
+        budget = pause_every or -1
+
+        while queue and not found:
+            budget -= 1
+            if budget == 0:
+                yield
+                budget = pause_every
+
+            node = queue.popleft()
+
+            for neighbor in successors(node):
+                if parents[neighbor] < 0:
+                    parents[neighbor] = node
+
+                    if neighbor == goal:
+                        found = True
+                        break
+                    queue.append(neighbor)
+
+        if get_path:
+            return (found, self._key_path(parents, goal) if found else [])
+        return found
+
+
+    @cached_query
+    def depth_first_search(self, goal, start=None, get_path=True):
+        start = self._check_search(start)
+        goal = self._goal_key(goal)
+
+        successors = self._successors
+        # Nodes are marked when pushed, so each one enters the stack only once
+        parents = array('q', [-1]) * self._capacity()
+        parents[start] = start
+        stack = [start]
+        found = False
+
+        if self._probe is not None:
+            self._probe.watch(stack)
+
+        while stack:
+            node = stack.pop()
+
+            if node == goal:
+                found = True
+                break
+
+            for neighbor in successors(node):
+                if parents[neighbor] < 0:
+                    parents[neighbor] = node
+                    stack.append(neighbor)
+
+        if get_path:
+            return (found, self._key_path(parents, goal) if found else [])
+        return found
+
+
+    def _meeting_path(self, forward, backward, meeting) -> list:
+        # Start of the path from the forward parents, end from the backward ones
+        path = self._key_path(forward, meeting)
+
+        key = meeting
+        while backward[key] != key:
+            key = backward[key]
+            path.append(self._label(key))
+
+        return path
+
+
+    @cached_query
+    def bidirectional_search(self, goal, start=None, get_path=True):
+        '''
+        Breadth-first search run both from 'start' and, backwards along the
+        incoming edges, from 'goal', always expanding a whole level of the
+        smaller frontier, until the two searches meet. Returns the same
+        results as breadth_first_search, with a path of fewest edges
+        '''
+        start = self._check_search(start)
+        goal = self._goal_key(goal)
+
+        found = goal is not None and start == goal
+        meeting = start
+
+        if goal is not None and not found:
+            capacity = self._capacity()
+            forward = array('q', [-1]) * capacity
+            backward = array('q', [-1]) * capacity
+            forward[start] = start
+            backward[goal] = goal
+            forward_level, backward_level = [start], [goal]
+
+            while forward_level and backward_level and not found:
+                if len(forward_level) <= len(backward_level):
+                    parents, others, level = forward, backward, forward_level
+                    neighbors = self._successors
+                else:
+                    parents, others, level = backward, forward, backward_level
+                    neighbors = self._predecessor_keys
+
+                next_level = []
+                for node in level:
+                    for neighbor in neighbors(node):
+                        if parents[neighbor] < 0:
+                            parents[neighbor] = node
+                            next_level.append(neighbor)
+
+                            if others[neighbor] >= 0:
+                                found, meeting = True, neighbor
+                                break
+                    if found:
+                        break
+
+                if parents is forward:
+                    forward_level = next_level
+                else:
+                    backward_level = next_level
+
+        if get_path:
+            if not found:
+                return (False, [])
+            if start == goal:
+                return (True, [self._label(start)])
+            return (True, self._meeting_path(forward, backward, meeting))
+        return found
+
+
+    def _predecessor_keys(self, key):
+        return [u for u, _ in self._weighted_predecessors(key)]
+
+
+    @cached_query
+    def bidirectional_dijkstra(self, goal, start=None, get_path=False):
+        '''
+        Dijkstra run both from 'start' and, backwards along the incoming
+        edges, from 'goal', stopping once the smallest tentative distances of
+        the two heaps add up to at least the best path seen so far. Returns
+        the same (found, cost) as uniform_cost_search, or (found, cost, path)
+        if 'get_path' is set
+        '''
+        start = self._check_search(start)
+        goal = self._goal_key(goal)
+
+        if goal is None:
+            return (False, [], []) if get_path else (False, [])
+        if start == goal:
+            return (True, 0, [self._label(start)]) if get_path else (True, 0)
+
+        heappush, heappop = self._heappush, heapq.heappop
+        forward = _DijkstraState(self._capacity())
+        backward = _DijkstraState(self._capacity())
+        forward.distances[start], forward.parents[start] = 0, start
+        backward.distances[goal], backward.parents[goal] = 0, goal
+        forward_heap, backward_heap = [(0, start)], [(0, goal)]
+
+        best, meeting = INFINITY, None
+
+        while forward_heap and backward_heap:
+            if forward_heap[0][0] + backward_heap[0][0] >= best:
+                break
+
+            if forward_heap[0][0] <= backward_heap[0][0]:
+                state, other, heap = forward, backward, forward_heap
+                neighbors = self._weighted_successors
+            else:
+                state, other, heap = backward, forward, backward_heap
+                neighbors = self._weighted_predecessors
+
+            distance, node = heappop(heap)
+            if state.settled[node]:
+                continue
+            state.settled[node] = 1
+
+            distances, parents = state.distances, state.parents
+            other_distances = other.distances
+
+            for neighbor, weight in neighbors(node):
+                new_distance = distance + weight
+
+                if new_distance < distances[neighbor]:
+                    distances[neighbor] = new_distance
+                    parents[neighbor] = node
+                    heappush(heap, (new_distance, neighbor))
+
+                # A path through this node joins the two searches
+                total = distances[neighbor] + other_distances[neighbor]
+                if total < best:
+                    best, meeting = total, neighbor
+
+        if meeting is None:
+            return (False, [], []) if get_path else (False, [])
+        if get_path:
+            return (True, best, self._meeting_path(forward.parents, backward.parents, meeting))
+        return (True, best)
+
+
+    @cached_query
+    def a_star(self, start, goal, heuristic=None, get_path=False):
+        '''
+        Shortest path search from 'start' to 'goal', which unlike the other
+        searches take the start first, guided by heuristic(node, goal). The
+        heuristic must never overestimate the remaining distance for the
+        result to be optimal. See
+        src/heuristics.py for Euclidean and Manhattan distances. Without a
+        heuristic it behaves as uniform_cost_search. Returns (found, cost), or
+        (found, cost, path) if 'get_path' is set
+        '''
+        start = self._check_search(start)
+        goal_label = goal
+        goal = self._goal_key(goal)
+
+        if goal is None:
+            return (False, [], []) if get_path else (False, [])
+
+        weighted_successors = self._weighted_successors
+        label = self._label
+        heappush, heappop = self._heappush, heapq.heappop
+
+        capacity = self._capacity()
+        distances = [INFINITY] * capacity
+        parents = array('q', [-1]) * capacity
+        # The heuristic is only evaluated once per node
+        estimates = [None] * capacity
+
+        distances[start] = 0
+        parents[start] = start
+        heap = [(0, 0, start)]
+
+        if self._probe is not None:
+            self._probe.watch(heap)
+
+        while heap:
+            _, distance, node = heappop(heap)
+
+            # Outdated entry. Nodes are reopened when a shorter path shows up,
+            # so heuristics that are admissible but not consistent still work
+            if distance > distances[node]:
+                continue
+
+            if node == goal:
+                if get_path:
+                    return (True, distance, self._key_path(parents, goal))
+                return (True, distance)
+
+            for neighbor, weight in weighted_successors(node):
+                new_distance = distance + weight
+
+                if new_distance < distances[neighbor]:
+                    distances[neighbor] = new_distance
+                    parents[neighbor] = node
+
+                    estimate = estimates[neighbor]
+                    if estimate is None:
+                        estimate = heuristic(label(neighbor), goal_label) if heuristic is not None else 0
+                        estimates[neighbor] = estimate
+                    heappush(heap, (new_distance + estimate, new_distance, neighbor))
+
+        return (False, [], []) if get_path else (False, [])
+
+
+    def iter_bfs(self, start, max_depth=None):
+        '''
+        Lazily yields (node, depth, parent) for every node reachable from
+        'start', in breadth-first order. Nodes deeper than 'max_depth' are not
+        visited, and the caller may stop iterating at any time
+        '''
+        return self._iter_bfs(self._key(start), max_depth)
+
+
+    def _iter_bfs(self, start, max_depth):
+        successors = self._successors
+        label = self._label
+        seen = bytearray(self._capacity())
+        seen[start] = 1
+        queue = deque([(start, 0, None)])
+
+        while queue:
+            node, depth, parent = queue.popleft()
+            yield label(node), depth, (None if parent is None else label(parent))
+
+            if depth == max_depth:
+                continue
+
+            for neighbor in successors(node):
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
+                    queue.append((neighbor, depth + 1, node))
+
+
+    def iter_dfs(self, start, max_depth=None):
+        '''
+        Lazily yields (node, depth, parent) for every node reachable from
+        'start', in the same depth-first order as depth_first_search
+        '''
+        return self._iter_dfs(self._key(start), max_depth)
+
+
+    def _iter_dfs(self, start, max_depth):
+        successors = self._successors
+        label = self._label
+        seen = bytearray(self._capacity())
+        seen[start] = 1
+        stack = [(start, 0, None)]
+
+        while stack:
+            node, depth, parent = stack.pop()
+            yield label(node), depth, (None if parent is None else label(parent))
+
+            if depth == max_depth:
+                continue
+
+            for neighbor in successors(node):
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
+                    stack.append((neighbor, depth + 1, node))
+
+
+    def _run_dijkstra(self, state, starts, targets=None, remaining=0):
+        '''
+        Settles nodes in order of distance from the 'starts' keys, using a
+        binary heap in which outdated entries are skipped when popped instead
+        of being updated. When a 'targets' bytearray is given, the search stops
+        as soon as 'remaining' of the flagged keys are settled
+        '''
+        _run(self._dijkstra_steps(state, starts, targets, remaining))
+
+
+    def _dijkstra_steps(self, state, starts, targets=None, remaining=0, pause_every=0):
+        '''
+        _run_dijkstra as a generator, which pauses (yields) after every
+        'pause_every' settled nodes, or never when 0. The storage hooks are
+        bound right away
+        '''
+        distances, parents = state.distances, state.parents
+
+        heap = []
+        for start in starts:
+            distances[start] = 0
+            parents[start] = start
+            heap.append((0, start))
+
+        if self._probe is not None:
+            self._probe.watch(heap)
+
+        return self._dijkstra_loop(self._weighted_successors, self._heappush, heap, state, targets, remaining, pause_every)
+
+
+    def _dijkstra_loop(self, weighted_successors, heappush, heap, state, targets, remaining, pause_every):
+        heappop = heapq.heappop
+        distances, parents, settled, order = state.distances, state.parents, state.settled, state.order
+        budget = pause_every or -1
+
+        while heap:
+            distance, node = heappop(heap)
+
+            if settled[node]:
+                continue
+            settled[node] = 1
+            order.append(node)
+
+            if targets is not None and targets[node]:
+                remaining -= 1
+                if remaining <= 0:
+                    break
+
+            budget -= 1
+            if budget == 0:
+                yield
+                budget = pause_every
+
+            for neighbor, weight in weighted_successors(node):
+                new_distance = distance + weight
+
+                if new_distance < distances[neighbor]:
+                    distances[neighbor] = new_distance
+                    parents[neighbor] = node
+                    heappush(heap, (new_distance, neighbor))
+
+        # Remaining entries are the only unsettled nodes the search touched
+        state.frontier = heap
+
+
+    def dijkstra(self, start, goal=None):
+        '''
+        Shortest path distances from 'start'. Returns the dictionaries
+        (distances, predecessors), holding every node settled before 'goal' is
+        reached, or every reachable node if no goal is given. The path to a
+        node can be rebuilt with build_path
+        '''
+        return _run(self._dijkstra(start, goal))
+
+
+    def _dijkstra(self, start, goal, pause_every=0):
+        # Generator version of dijkstra, see _dijkstra_steps
+        start = self._key(start)
+        goal = None if goal is None else self._goal_key(goal)
+
+        state = _DijkstraState(self._capacity())
+        targets = None
+        if goal is not None:
+            targets = bytearray(self._capacity())
+            targets[goal] = 1
+
+        steps = self._dijkstra_steps(state, [start], targets, 1, pause_every)
+        return _then(steps, functools.partial(self._dijkstra_result, state))
+
+
+    def abfs(self, goal, start=None, get_path=True, yield_every=1000, deadline=None, executor=None):
+        '''
+        Coroutine version of breadth_first_search, which lets the event loop
+        run other tasks after every 'yield_every' expanded nodes, and raises
+        asyncio.TimeoutError past 'deadline', a time of the loop's clock.
+        With an 'executor', the search runs there instead. See src/aio.py
+        '''
+        from . import aio
+
+        if executor is not None:
+            # Called on the class, as the instance may hold stats hooks
+            return aio.offload(executor, deadline, functools.partial(type(self).breadth_first_search, self, goal, start, get_path))
+
+        key, result = cache.lookup(self, BaseGraph.breadth_first_search, goal, start, get_path)
+        if result is not cache._MISSING:
+            return aio.done(result)
+
+        steps = self._breadth_first_search(goal, start, get_path, yield_every)
+        return aio.drive(self, steps, deadline, functools.partial(cache.store, self, key))
+
+
+    def adijkstra(self, start, goal=None, yield_every=1000, deadline=None, executor=None):
+        '''
+        Coroutine version of dijkstra, with the same arguments as abfs
+        '''
+        from . import aio
+
+        if executor is not None:
+            return aio.offload(executor, deadline, functools.partial(type(self).dijkstra, self, start, goal))
+
+        return aio.drive(self, self._dijkstra(start, goal, yield_every), deadline)
+
+
+    def _dijkstra_result(self, state):
+        # Tentative distances of unsettled nodes are not shortest distances
+        label = self._label
+        distances, parents = state.distances, state.parents
+        result_distances = {}
+        result_predecessors = {}
+        for node in state.order:
+            parent = parents[node]
+            result_distances[label(node)] = distances[node]
+            result_predecessors[label(node)] = None if parent == node else label(parent)
+
+        return result_distances, result_predecessors
+
+
+    def shortest_paths_many(self, sources, targets=None) -> list:
+        '''
+        Distance matrix from every node in 'sources' to every node in
+        'targets' (all nodes by default), as a list with one row per source.
+        Unreachable targets get an infinite distance. Each source runs its own
+        Dijkstra, which stops once every target is settled, and the arrays of
+        the search are reused between sources
+        '''
+        sources = [self._key(node) for node in sources]
+        if targets is None:
+            targets = list(self._node_keys())
+        else:
+            targets = [self._key(node) for node in targets]
+
+        if not targets:
+            return [[] for _ in sources]
+
+        is_target = bytearray(self._capacity())
+        for target in targets:
+            is_target[target] = 1
+        remaining = sum(is_target)
+
+        state = _DijkstraState(self._capacity())
+        matrix = []
+
+        for source in sources:
+            self._run_dijkstra(state, [source], is_target, remaining)
+
+            distances, settled = state.distances, state.settled
+            matrix.append([distances[t] if settled[t] else INFINITY for t in targets])
+
+            state.reset()
+
+        return matrix
+
+
+    def nearest_source(self, sources, targets=None) -> dict:
+        '''
+        For every reachable node in 'targets' (all nodes by default), returns
+        (source, distance) for its closest node in 'sources'. All sources are
+        searched at once, as if linked to a virtual super source by edges of
+        weight zero
+        '''
+        starts = [self._key(node) for node in sources]
+
+        is_target = None
+        remaining = 0
+        if targets is not None:
+            targets = [self._key(node) for node in targets]
+            is_target = bytearray(self._capacity())
+            for target in targets:
+                is_target[target] = 1
+            remaining = sum(is_target)
+
+        state = _DijkstraState(self._capacity())
+        self._run_dijkstra(state, starts, is_target, remaining)
+
+        # Parents are settled before their children, so roots propagate in order
+        label = self._label
+        distances, parents = state.distances, state.parents
+        roots = {}
+        nearest = {}
+        for node in state.order:
+            parent = parents[node]
+            root = node if parent == node else roots[parent]
+            roots[node] = root
+
+            if is_target is None or is_target[node]:
+                nearest[label(node)] = (label(root), distances[node])
+
+        return nearest
+
+
+    @cached_query
+    def uniform_cost_search(self, goal, start=None):
+        start = self._check_search(start)
+
+        distances, _ = self.dijkstra(self._label(start), goal)
+
+        if goal in distances:
+            return (True, distances[goal])
+        return (False, [])
+
+
+def _run(steps):
+    # Runs a search generator to its end without pausing, returning its result
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+def _then(steps, result):
+    # Search generator returning result() once 'steps' are done
+    yield from steps
+    return result()
+
+
+class _DijkstraState():
+    '''
+    Arrays of a Dijkstra run, indexed by key. Distances are kept in a list so
+    that integer weights stay integers
+    '''
+
+    def __init__(self, capacity) -> None:
+        self.distances = [INFINITY] * capacity
+        self.parents = array('q', [-1]) * capacity
+        self.settled = bytearray(capacity)
+        self.order = []
+        self.frontier = []
+
+
+    def reset(self) -> None:
+        # Only the nodes reached by the last run need to be cleared
+        distances, parents, settled = self.distances, self.parents, self.settled
+
+        for node in self.order:
+            distances[node] = INFINITY
+            parents[node] = -1
+            settled[node] = 0
+        for _, node in self.frontier:
+            distances[node] = INFINITY
+            parents[node] = -1
+
+        self.order = []
+        self.frontier = []
+
+
+class _ConnectivityIndex():
+    '''
+    Union-find over the node keys of a graph. Graphs that can change get it
+    registered as a listener (see Graph._notify), so new edges are joined as
+    they are added, while removals, which union-find cannot undo, make it
+    rebuild on the next query
+    '''
+
+    def __init__(self, graph) -> None:
+        self._graph = graph
+        self._union_find = None
+
+        listeners = getattr(graph, '_listeners', None)
+        if listeners is not None:
+            listeners.append(self)
+
+
+    def union_find(self) -> UnionFind:
+        if self._union_find is None:
+            graph = self._graph
+            union_find = UnionFind(graph._capacity())
+
+            for u in graph._node_keys():
+                for v in graph._successors(u):
+                    union_find.union(u, v)
+            self._union_find = union_find
+        else:
+            # Nodes added without edges are sets of their own
+            self._union_find.grow(self._graph._capacity())
+
+        return self._union_find
+
+
+    def connected(self, u, v) -> bool:
+        return self.union_find().connected(u, v)
+
+
+    def _on_edge(self, i, j, old, new) -> None:
+        if self._union_find is None:
+            return
+
+        if old is None:
+            self.union_find().union(i, j)
+        elif new is None:
+            self._union_find = None
+
+
+    def _on_node_removed(self, i) -> None:
+        self._union_find = None
+
+
+    def _on_reset(self) -> None:
+        self._union_find = None
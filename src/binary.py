@@ -0,0 +1,143 @@
+'''
+Binary graph files, holding a FrozenGraph as it is laid out in memory:
+
+    header      magic, format version, flags, node count, edge count and
+                size of the label table (see _HEADER)
+    labels      pickled list of the node labels, in id order
+    offsets     (nodes + 1) int64 values
+    targets     edges int32 values, or int64 when flagged as wide
+    weights     edges int64 or float64 values, only in weighted graphs
+
+Every array starts at a multiple of 8 bytes and uses the byte order of the
+machine that wrote it. Loading with mmap maps the arrays straight from the
+page cache, so processes loading the same file share one copy.
+
+Labels are stored with pickle, so only load files from trusted sources.
+'''
+import mmap as _mmap
+import pickle
+import struct
+import sys
+from array import array
+
+from .csr import FrozenGraph, _typecode
+
+
+_MAGIC = b'GRAPHEX\x00'
+_VERSION = 1
+_HEADER = struct.Struct('<8sIIQQQ')
+
+_WEIGHTED = 1
+_DIRECTED = 2
+_FLOAT_WEIGHTS = 4
+_WIDE_INDICES = 8
+_BIG_ENDIAN = 16
+
+
+def _padding(size) -> int:
+    return -size % 8
+
+
+def save(graph, path) -> None:
+    '''
+    Writes the FrozenGraph 'graph' to 'path'
+    '''
+    labels = pickle.dumps(graph._labels, protocol=pickle.HIGHEST_PROTOCOL)
+
+    flags = 0
+    if graph._weighted:
+        flags |= _WEIGHTED
+        if _typecode(graph._weights) == 'd':
+            flags |= _FLOAT_WEIGHTS
+    if graph._directed:
+        flags |= _DIRECTED
+    if _typecode(graph._targets) == 'q':
+        flags |= _WIDE_INDICES
+    if sys.byteorder == 'big':
+        flags |= _BIG_ENDIAN
+
+    with open(path, 'wb') as file:
+        file.write(_HEADER.pack(_MAGIC, _VERSION, flags, len(graph._labels), len(graph._targets), len(labels)))
+        file.write(labels)
+        file.write(b'\x00' * _padding(_HEADER.size + len(labels)))
+
+        arrays = [graph._offsets, graph._targets]
+        if graph._weighted:
+            arrays.append(graph._weights)
+
+        for values in arrays:
+            data = memoryview(values).cast('B')
+            file.write(data)
+            file.write(b'\x00' * _padding(len(data)))
+
+
+def load(path, mmap=True) -> FrozenGraph:
+    '''
+    Reads a graph written by save. With 'mmap', the arrays are memoryviews
+    over the mapped file instead of copies, and the graph pickles as its path
+    '''
+    with open(path, 'rb') as file:
+        header = file.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError('{} is not a graph file'.format(path))
+
+        magic, version, flags, nodes, edges, labels_size = _HEADER.unpack(header)
+        if magic != _MAGIC:
+            raise ValueError('{} is not a graph file'.format(path))
+        if version != _VERSION:
+            raise ValueError('Unsupported graph file version {}'.format(version))
+
+        labels = file.read(labels_size)
+        if len(labels) < labels_size:
+            raise ValueError('{} is truncated'.format(path))
+        labels = pickle.loads(labels)
+        if len(labels) != nodes:
+            raise ValueError('{} holds {} labels for {} nodes'.format(path, len(labels), nodes))
+
+        # Files written with the other byte order cannot be used in place
+        swap = bool(flags & _BIG_ENDIAN) != (sys.byteorder == 'big')
+        if swap:
+            mmap = False
+
+        if mmap:
+            buffer = memoryview(_mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ))
+        else:
+            file.seek(0)
+            buffer = memoryview(file.read())
+
+    layout = [('q', nodes + 1), ('q' if flags & _WIDE_INDICES else 'i', edges)]
+    if flags & _WEIGHTED:
+        layout.append(('d' if flags & _FLOAT_WEIGHTS else 'q', edges))
+
+    position = _HEADER.size + labels_size
+    position += _padding(position)
+    arrays = []
+
+    for typecode, count in layout:
+        size = count * struct.calcsize(typecode)
+        # Slices past the end would silently come out short
+        if position + size > len(buffer):
+            raise ValueError('{} is truncated'.format(path))
+        data = buffer[position:position + size]
+
+        if mmap:
+            arrays.append(data.cast(typecode))
+        else:
+            values = array(typecode)
+            values.frombytes(data)
+            if swap:
+                values.byteswap()
+            arrays.append(values)
+
+        position += size + _padding(size)
+
+    offsets, targets = arrays[0], arrays[1]
+    weights = arrays[2] if flags & _WEIGHTED else None
+    if offsets[0] != 0 or offsets[-1] != edges:
+        raise ValueError('{} has offsets that do not match its {} edges'.format(path, edges))
+
+    G = FrozenGraph._from_arrays(labels, offsets, targets, weights, weighted=bool(flags & _WEIGHTED), directed=bool(flags & _DIRECTED))
+    if mmap:
+        G._path = path
+
+    return G
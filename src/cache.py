@@ -0,0 +1,131 @@
+from collections import OrderedDict, namedtuple
+import functools
+import inspect
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'size', 'maxsize'])
+
+
+class QueryCache():
+
+    def __init__(self, maxsize=128) -> None:
+        '''
+        Least recently used cache of query results. Every entry belongs to
+        one version of the graph, and the whole cache is dropped as soon as
+        it is read or written under a newer version
+        '''
+        if maxsize < 1:
+            raise ValueError('Cache size must be at least 1, got {}'.format(maxsize))
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+        self._version = None
+
+
+    def _sync(self, version) -> None:
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+
+
+    def get(self, key, version, default=None):
+        self._sync(version)
+
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+
+    def put(self, key, version, value) -> None:
+        self._sync(version)
+
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, len(self._entries), self.maxsize)
+
+
+_MISSING = object()
+
+
+def _copy(result):
+    # Paths are lists, so callers must not get the cached object itself
+    if isinstance(result, tuple):
+        return tuple(list(item) if isinstance(item, list) else item for item in result)
+    return result
+
+
+def _query_key(method, args, kwargs):
+    # Arguments are bound to their names, defaults included, so that every
+    # spelling of the same query shares one entry
+    arguments = method._signature.bind(*args, **kwargs)
+    arguments.apply_defaults()
+    return (method.__name__,) + tuple(arguments.arguments.items())[1:]
+
+
+def lookup(graph, method, *args, **kwargs):
+    '''
+    Looks up a call of the cached_query 'method' with the given arguments in
+    the graph's cache. Returns (key, result), where the key is None when the
+    call cannot be cached and the result is _MISSING when it is not stored
+    '''
+    cache = graph._cache
+    if cache is None:
+        return None, _MISSING
+
+    try:
+        key = _query_key(method, (graph,) + args, kwargs)
+        result = cache.get(key, graph._version, _MISSING)
+    except TypeError:
+        # Queries with unhashable arguments cannot be keyed, so they are
+        # simply not cached
+        return None, _MISSING
+
+    return key, (result if result is _MISSING else _copy(result))
+
+
+def store(graph, key, result):
+    # Stores the result of a call looked up with 'key', unless uncacheable
+    if key is not None and graph._cache is not None:
+        graph._cache.put(key, graph._version, result)
+    return _copy(result)
+
+
+def cached_query(method):
+    '''
+    Decorator for searches. Results are looked up in the graph's cache, keyed
+    on the method and its arguments, whenever the graph has a cache enabled
+    '''
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._cache is None:
+            return method(self, *args, **kwargs)
+
+        key, result = lookup(self, wrapper, *args, **kwargs)
+        if result is _MISSING:
+            result = store(self, key, method(self, *args, **kwargs))
+
+        return result
+
+    wrapper._signature = inspect.signature(method)
+    return wrapper
@@ -0,0 +1,248 @@
+import threading
+from contextlib import contextmanager
+
+from .base import BaseGraph
+from .graphex import Graph
+
+
+# Settings of a single snapshot, which would be lost with the next one
+_PER_SNAPSHOT = frozenset(('enable_cache', 'disable_cache', 'cache_info', 'enable_stats', 'disable_stats', 'get_stats'))
+
+
+def _thaw(snapshot) -> Graph:
+    # Mutable copy of a FrozenGraph, with its nodes in the same order
+    G = Graph(weighted=snapshot._weighted, directed=snapshot._directed)
+    G.add_nodes(snapshot.get_nodes())
+
+    label = snapshot._label
+    if snapshot._weighted:
+        G.add_edges_bulk((label(u), label(v), w) for u in snapshot._node_keys() for v, w in snapshot._weighted_successors(u))
+    else:
+        G.add_edges_bulk((label(u), label(v)) for u in snapshot._node_keys() for v in snapshot._successors(u))
+
+    return G
+
+
+class _BatchProxy():
+    '''
+    Stands for the private Graph during a batch, and stops working once the
+    batch ends, so the graph cannot be changed outside of the lock
+    '''
+
+    __slots__ = ('_graph',)
+
+    def __init__(self, graph) -> None:
+        self._graph = graph
+
+
+    def __getattr__(self, name):
+        if self._graph is None:
+            raise RuntimeError('The batch has ended, changes must be made in a new one')
+        return getattr(self._graph, name)
+
+
+class ConcurrentGraph():
+
+    def __init__(self, graph=None, weighted=False, directed=False, max_pending=64, max_delay=0.05) -> None:
+        '''
+        A graph shared between threads through versioned immutable snapshots
+        (multiversion concurrency control). Writers change a private Graph
+        under a lock, and publish it as a new FrozenGraph. Readers only fetch
+        the latest snapshot, a single reference read, so they never wait for
+        writers and never see a batch half applied. Queries called on this
+        object run on the snapshot current at the time of the call; use
+        snapshot() to run several queries on the same version.
+
+        Publishing freezes the whole graph, which costs O(V + E) whatever the
+        size of the change. Single writes (add_edges, update_weight, ...) are
+        therefore queued and published together by writers: by the write
+        that brings 'max_pending' of them, by a timer 'max_delay' seconds
+        after the first one, or by flush(). Until then, readers, including
+        the thread that made the write, still see the previous snapshot.
+        batch() publishes its changes as soon as it ends.
+
+        'graph', if given, becomes the initial contents and must not be
+        changed directly afterwards
+        '''
+        if max_pending < 1:
+            raise ValueError('max_pending must be at least 1, got {}'.format(max_pending))
+
+        self._graph = graph if graph is not None else Graph(weighted=weighted, directed=directed)
+        self._lock = threading.Lock()
+        self._version = 0
+        self._snapshot = self._graph.freeze()
+        # Writes applied to the private graph but not yet published
+        self._pending = []
+        self._timer = None
+        self.max_pending = max_pending
+        self.max_delay = max_delay
+
+
+    def snapshot(self):
+        '''
+        Returns the latest published FrozenGraph. It never changes, so it may
+        be searched from any number of threads, though its query cache and
+        stats must then stay disabled, as they are not thread-safe
+        '''
+        return self._snapshot
+
+
+    def version(self) -> int:
+        # Number of snapshots published so far
+        return self._version
+
+
+    def __getattr__(self, name):
+        # Read-only queries are answered by the current snapshot
+        if name.startswith('_') or name in _PER_SNAPSHOT or not hasattr(BaseGraph, name):
+            raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+        return getattr(self._snapshot, name)
+
+
+    # Writes
+
+    def _publish(self) -> None:
+        # O(V + E), as the whole graph is frozen. Callers hold the lock
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        try:
+            snapshot = self._graph.freeze()
+        except Exception:
+            self._recover()
+            raise
+
+        self._snapshot = snapshot
+        self._version += 1
+        self._pending = []
+
+
+    def _recover(self) -> None:
+        # Freezing failed on some write. The pending writes are replayed on
+        # the last snapshot one at a time, freezing after each, so that only
+        # those that cannot be published are dropped. Costs O(V + E) per
+        # pending write, but only when a publish fails
+        snapshot = self._snapshot
+        pending, self._pending = self._pending, []
+        self._graph = _thaw(snapshot)
+
+        for name, args in pending:
+            try:
+                getattr(self._graph, name)(*args)
+                snapshot = self._graph.freeze()
+            except Exception:
+                self._graph = _thaw(snapshot)
+
+        if snapshot is not self._snapshot:
+            self._snapshot = snapshot
+            self._version += 1
+
+
+    def _roll_back(self) -> None:
+        # Rebuilds the private graph from the last snapshot, replaying the
+        # pending writes, which costs O(V + E) as well. Callers hold the lock
+        self._graph = _thaw(self._snapshot)
+        for name, args in self._pending:
+            getattr(self._graph, name)(*args)
+
+
+    def flush(self) -> None:
+        '''
+        Publishes the pending single writes as one new snapshot, if any. A
+        write that cannot be published is dropped, and its error raised
+        '''
+        with self._lock:
+            if self._pending:
+                self._publish()
+
+
+    @contextmanager
+    def batch(self):
+        '''
+        Yields a proxy of the private Graph for any number of changes,
+        published to readers as one new snapshot at the end of the block,
+        together with any pending writes. If the block raises, or its
+        changes cannot be published, none of them are kept. Batches run one
+        at a time, and the proxy stops working when the block ends. Both
+        publishing and rolling back cost O(V + E)
+        '''
+        with self._lock:
+            proxy = _BatchProxy(self._graph)
+            try:
+                yield proxy
+            except BaseException:
+                self._roll_back()
+                raise
+            finally:
+                proxy._graph = None
+
+            try:
+                snapshot = self._graph.freeze()
+            except Exception:
+                # Drops the batch, and any pending write at fault
+                self._recover()
+                raise
+
+            # Pending writes are published along with the batch
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._snapshot = snapshot
+            self._version += 1
+            self._pending = []
+
+
+    def _write(self, name, *args) -> None:
+        # Applies a single write now and queues its publication. A failed
+        # write rolls back, so it leaves no partial change. Lists are copied,
+        # as the caller may reuse them before a replay
+        args = tuple(list(arg) if isinstance(arg, list) else arg for arg in args)
+
+        with self._lock:
+            try:
+                getattr(self._graph, name)(*args)
+            except BaseException:
+                self._roll_back()
+                raise
+
+            self._pending.append((name, args))
+            if len(self._pending) >= self.max_pending:
+                self._publish()
+            elif self._timer is None and self.max_delay is not None:
+                self._timer = threading.Timer(self.max_delay, self._publish_later)
+                self._timer.daemon = True
+                self._timer.start()
+
+
+    def _publish_later(self) -> None:
+        # Runs on the timer thread, where an error could not reach any
+        # writer. The write at fault is dropped all the same
+        try:
+            self.flush()
+        except Exception:
+            pass
+
+
+    def add_nodes(self, nodes) -> None:
+        self._write('add_nodes', nodes)
+
+
+    def add_edges(self, edges) -> None:
+        self._write('add_edges', edges)
+
+
+    def add_edges_bulk(self, edges) -> None:
+        self._write('add_edges_bulk', list(edges))
+
+
+    def update_weight(self, edge: tuple, weight) -> None:
+        self._write('update_weight', edge, weight)
+
+
+    def remove_nodes(self, nodes) -> None:
+        self._write('remove_nodes', nodes)
+
+
+    def remove_edges(self, edges) -> None:
+        self._write('remove_edges', edges)
@@ -0,0 +1,213 @@
+from array import array
+from itertools import repeat
+
+from .base import BaseGraph
+
+
+def _index_typecode(size) -> str:
+    # 4 byte indices whenever they fit, halving the memory of the arrays
+    return 'i' if size < 2 ** 31 else 'q'
+
+
+def _typecode(values) -> str:
+    # Arrays may also be memoryviews over a mapped file, see src/binary.py
+    return getattr(values, 'typecode', None) or values.format
+
+
+class FrozenGraph(BaseGraph):
+
+    def __init__(self, nodes, adjacency, weighted=False, directed=False) -> None:
+        '''
+        An immutable compressed sparse row (CSR) snapshot of a graph. Nodes get
+        the integer ids 0..n-1, in the order given. The neighbors of node 'i'
+        are _targets[_offsets[i]:_offsets[i + 1]], and their edge weights are
+        stored at the same positions of _weights, which is None when the graph
+        is unweighted. 'adjacency' holds, for each node, its (v, w) pairs
+        '''
+        self._weighted = weighted
+        self._directed = directed
+
+        self._labels = list(nodes)
+        self._ids = {node: i for i, node in enumerate(self._labels)}
+
+        ids = self._ids
+        offsets = array('q', [0])
+        targets = array(_index_typecode(len(self._labels)))
+        weights = []
+
+        for pairs in adjacency:
+            for v, w in pairs:
+                targets.append(ids[v])
+                weights.append(w)
+            offsets.append(len(targets))
+
+        if len(offsets) != len(self._labels) + 1:
+            raise ValueError('Expected the adjacency of {} nodes, got {}'.format(len(self._labels), len(offsets) - 1))
+
+        self._offsets = offsets
+        self._targets = targets
+        self._weights = None
+
+        # Incoming edges of directed graphs, only built when first needed
+        self._reverse = None
+
+        if weighted:
+            # Integer weights stay integers, anything else is stored as a float,
+            # as are integers too large for int64
+            if all(type(w) is int for w in weights):
+                try:
+                    self._weights = array('q', weights)
+                except OverflowError:
+                    pass
+            if self._weights is None:
+                self._weights = array('d', weights)
+
+
+    @classmethod
+    def _from_arrays(cls, nodes, offsets, targets, weights, weighted=False, directed=False):
+        '''
+        Wraps existing CSR arrays, or memoryviews over them, without copying
+        '''
+        G = cls.__new__(cls)
+        G._weighted = weighted
+        G._directed = directed
+        G._labels = list(nodes)
+        G._ids = {node: i for i, node in enumerate(G._labels)}
+        G._offsets = offsets
+        G._targets = targets
+        G._weights = weights
+        G._reverse = None
+
+        return G
+
+
+    def __reduce__(self):
+        # Graphs mapped from a file travel as their path, so that every
+        # process maps the same file instead of receiving a copy
+        path = getattr(self, '_path', None)
+        if path is not None:
+            from .binary import load
+            return (load, (path, True))
+
+        return super().__reduce__()
+
+
+    def save(self, path) -> None:
+        '''
+        Writes the graph in the binary format described in src/binary.py,
+        which Graph.load reads back, optionally memory-mapped
+        '''
+        from .binary import save
+        save(self, path)
+
+
+    def __repr__(self) -> str:
+        return '<FrozenGraph with {} nodes and {} edges>'.format(len(self._labels), len(self._targets))
+
+
+    # Storage hooks
+
+    def _node_count(self) -> int:
+        return len(self._labels)
+
+
+    def _node_keys(self):
+        return range(len(self._labels))
+
+
+    def _capacity(self) -> int:
+        return len(self._labels)
+
+
+    def _key(self, node):
+        try:
+            return self._ids[node]
+        except (KeyError, TypeError):
+            raise KeyError('{} is not a node of the graph'.format(node)) from None
+
+
+    def _label(self, key):
+        return self._labels[key]
+
+
+    def _successors(self, key):
+        return self._targets[self._offsets[key]:self._offsets[key + 1]]
+
+
+    def _weighted_successors(self, key):
+        start, end = self._offsets[key], self._offsets[key + 1]
+
+        if self._weights is None:
+            return zip(self._targets[start:end], repeat(1))
+        return zip(self._targets[start:end], self._weights[start:end])
+
+
+    def _weighted_predecessors(self, key):
+        # In an undirected graph, every incoming edge mirrors an outgoing one
+        if not self._directed:
+            offsets, sources, weights = self._offsets, self._targets, self._weights
+        else:
+            if self._reverse is None:
+                self._reverse = self._build_reverse()
+            offsets, sources, weights = self._reverse
+
+        start, end = offsets[key], offsets[key + 1]
+        if weights is None:
+            return zip(sources[start:end], repeat(1))
+        return zip(sources[start:end], weights[start:end])
+
+
+    def _build_reverse(self):
+        # Counting sort of the edges by their target node
+        n = len(self._labels)
+        offsets = array('q', [0]) * (n + 1)
+        for v in self._targets:
+            offsets[v + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        position = array('q', offsets[:n])
+        sources = array(_typecode(self._targets), [0]) * len(self._targets)
+        weights = None if self._weights is None else array(_typecode(self._weights), [0]) * len(self._weights)
+
+        for u in range(n):
+            for k in range(self._offsets[u], self._offsets[u + 1]):
+                v = self._targets[k]
+                sources[position[v]] = u
+                if weights is not None:
+                    weights[position[v]] = self._weights[k]
+                position[v] += 1
+
+        return offsets, sources, weights
+
+
+    def in_degree(self, node) -> int:
+        key = self._key(node)
+        if not self._directed:
+            return self._offsets[key + 1] - self._offsets[key]
+
+        if self._reverse is None:
+            self._reverse = self._build_reverse()
+        offsets = self._reverse[0]
+
+        return offsets[key + 1] - offsets[key]
+
+
+    def _has_edges(self) -> bool:
+        return len(self._targets) > 0
+
+
+    # Queries
+
+    def get_weight(self, edge: tuple):
+        u, v = edge
+        key = self._key(u)
+
+        target = self._ids.get(v)
+        if target is not None:
+            for neighbor, weight in self._weighted_successors(key):
+                if neighbor == target:
+                    return weight
+
+        raise KeyError('Edge {} is not in the graph'.format((u, v)))
+
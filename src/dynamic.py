@@ -0,0 +1,170 @@
+import heapq
+from array import array
+
+from .base import INFINITY, _DijkstraState
+
+
+class _Tree():
+
+    def __init__(self, source) -> None:
+        self.source = source
+        self.distances = []
+        self.parents = array('q')
+        self.stale = True
+
+
+class DynamicShortestPaths():
+
+    def __init__(self, graph, sources=()) -> None:
+        '''
+        Keeps the shortest path trees from a set of source nodes up to date
+        while 'graph' changes. A new edge or a lower weight only repairs the
+        part of each tree whose distances improve. A higher weight, or a
+        removed edge or node, only matters when it belongs to a tree, and
+        then that tree is recomputed the next time it is queried. Call close()
+        to stop following the graph
+        '''
+        self._graph = graph
+        self._trees = {}
+
+        for source in sources:
+            self.add_source(source)
+
+        graph._listeners.append(self)
+
+
+    def close(self) -> None:
+        if self in self._graph._listeners:
+            self._graph._listeners.remove(self)
+
+
+    def add_source(self, source) -> None:
+        self._graph._key(source)
+
+        if source not in self._trees:
+            self._trees[source] = _Tree(source)
+
+
+    def remove_source(self, source) -> None:
+        del self._trees[source]
+
+
+    def get_sources(self) -> list:
+        return list(self._trees)
+
+
+    # Queries
+
+    def _tree(self, source) -> _Tree:
+        if source is None:
+            if len(self._trees) != 1:
+                raise ValueError('A source must be given when tracking {} sources'.format(len(self._trees)))
+            source = next(iter(self._trees))
+
+        try:
+            tree = self._trees[source]
+        except KeyError:
+            raise KeyError('{} is not a tracked source'.format(source)) from None
+
+        if tree.stale:
+            self._recompute(tree)
+        return tree
+
+
+    def distance(self, node, source=None):
+        '''
+        Distance from 'source' to 'node', which is infinite when unreachable.
+        The source may be omitted when only one is tracked
+        '''
+        tree = self._tree(source)
+        key = self._graph._key(node)
+
+        return tree.distances[key] if key < len(tree.distances) else INFINITY
+
+
+    def distances(self, source=None) -> dict:
+        tree = self._tree(source)
+        label = self._graph._label
+
+        return {label(key): distance for key, distance in enumerate(tree.distances) if distance != INFINITY}
+
+
+    def path(self, node, source=None) -> list:
+        tree = self._tree(source)
+        key = self._graph._key(node)
+
+        if key >= len(tree.distances) or tree.distances[key] == INFINITY:
+            return []
+        return self._graph._key_path(tree.parents, key)
+
+
+    # Maintenance
+
+    def _recompute(self, tree) -> None:
+        graph = self._graph
+        state = _DijkstraState(graph._capacity())
+        graph._run_dijkstra(state, [graph._key(tree.source)])
+
+        tree.distances = state.distances
+        tree.parents = state.parents
+        tree.stale = False
+
+
+    def _grow(self, tree) -> None:
+        # Nodes added since the tree was computed start unreachable
+        missing = self._graph._capacity() - len(tree.distances)
+        if missing > 0:
+            tree.distances.extend([INFINITY] * missing)
+            tree.parents.extend(array('q', [-1]) * missing)
+
+
+    def _repair(self, tree, i, j, weight) -> None:
+        distances, parents = tree.distances, tree.parents
+
+        new_distance = distances[i] + weight
+        if not new_distance < distances[j]:
+            return
+
+        distances[j] = new_distance
+        parents[j] = i
+
+        # Dijkstra from 'j', only following edges that improve a distance
+        weighted_successors = self._graph._weighted_successors
+        heap = [(new_distance, j)]
+
+        while heap:
+            distance, node = heapq.heappop(heap)
+            if distance > distances[node]:
+                continue
+
+            for neighbor, weight in weighted_successors(node):
+                new_distance = distance + weight
+
+                if new_distance < distances[neighbor]:
+                    distances[neighbor] = new_distance
+                    parents[neighbor] = node
+                    heapq.heappush(heap, (new_distance, neighbor))
+
+
+    def _on_edge(self, i, j, old, new) -> None:
+        for tree in self._trees.values():
+            if tree.stale:
+                continue
+            self._grow(tree)
+
+            if new is not None and (old is None or new < old):
+                self._repair(tree, i, j, new)
+            elif tree.parents[j] == i and j != i:
+                # A tree edge got longer or was removed
+                tree.stale = True
+
+
+    def _on_node_removed(self, i) -> None:
+        for tree in self._trees.values():
+            if not tree.stale and i < len(tree.distances) and tree.distances[i] != INFINITY:
+                tree.stale = True
+
+
+    def _on_reset(self) -> None:
+        for tree in self._trees.values():
+            tree.stale = True
@@ -0,0 +1,87 @@
+'''
+Edge list files, with one edge per line in the form "u v" or "u v w".
+Files are written compressed with gzip when their name ends in .gz, and
+compressed files are recognized by their content when read.
+'''
+import gzip
+from itertools import islice
+
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+
+def _open(path, mode):
+    if 'r' in mode:
+        with open(path, 'rb') as file:
+            compressed = file.read(2) == _GZIP_MAGIC
+    else:
+        compressed = str(path).endswith('.gz')
+
+    if compressed:
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def _parse(lines, weighted, delimiter, nodetype, comments):
+    columns = 3 if weighted else 2
+
+    for number, line in lines:
+        if comments:
+            line = line.split(comments, 1)[0]
+
+        # Blank and comment lines are skipped
+        if not line.strip():
+            continue
+
+        fields = line.split(delimiter)
+        if len(fields) < columns:
+            raise ValueError('Line {}: expected {} columns, got {!r}'.format(number, columns, line.rstrip('\n')))
+
+        u, v = fields[0].strip(), fields[1].strip()
+        if nodetype is not None:
+            try:
+                u, v = nodetype(u), nodetype(v)
+            except (TypeError, ValueError):
+                raise ValueError('Line {}: invalid node in {!r}'.format(number, line.rstrip('\n'))) from None
+
+        if weighted:
+            yield u, v, fields[2].strip()
+        else:
+            yield u, v
+
+
+def read_edgelist(graph, path, delimiter=None, nodetype=None, comments='#', chunk_size=65536) -> None:
+    '''
+    Adds the edges listed in the file at 'path' to 'graph'. Columns are split
+    on 'delimiter' (any whitespace by default), and 'nodetype', such as int,
+    converts node labels, which are strings otherwise. Extra columns are
+    ignored. The file is parsed 'chunk_size' lines at a time, so memory use
+    does not depend on its size
+    '''
+    with _open(path, 'r') as file:
+        edges = _parse(enumerate(file, 1), graph._weighted, delimiter, nodetype, comments)
+
+        while True:
+            chunk = list(islice(edges, chunk_size))
+            if not chunk:
+                break
+            graph.add_edges_bulk(chunk)
+
+
+def write_edgelist(graph, path, delimiter=' ') -> None:
+    '''
+    Writes every edge of 'graph' to 'path', once per line. Undirected edges
+    are written in a single direction, and nodes without edges are left out
+    '''
+    label = graph._label
+
+    with _open(path, 'w') as file:
+        for u in graph._node_keys():
+            for v, w in graph._weighted_successors(u):
+                if not graph._directed and v < u:
+                    continue
+
+                if graph._weighted:
+                    file.write('{}{}{}{}{}\n'.format(label(u), delimiter, label(v), delimiter, w))
+                else:
+                    file.write('{}{}{}\n'.format(label(u), delimiter, label(v)))
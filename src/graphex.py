@@ -1,46 +1,217 @@
-class Graph():
+import itertools
+import numbers
+
+from .base import BaseGraph
+from . import binary, linalg
+from .csr import FrozenGraph
+from .edgelist import read_edgelist
+
+
+def _to_number(weight):
+    '''
+    Edge weights are kept as numbers so that searches never truncate them.
+    Numeric strings, such as '118' or '2.5', are converted on insertion
+    '''
+    if isinstance(weight, numbers.Number):
+        return weight
+
+    try:
+        return int(weight)
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        return float(weight)
+    except (TypeError, ValueError):
+        raise TypeError('Edge weights must be numbers, got {!r}'.format(weight)) from None
+
+
+# Marks the label of an id that was freed by remove_nodes
+_FREE = object()
+
+# Default of next() when add_edges_bulk gets no edges
+_NO_EDGE = object()
+
+
+class Graph(BaseGraph):
+
+    # How each instrumented mutation passes edges, see src/stats.py
+    _instrumented_mutations = (('add_nodes', None), ('add_edges', 'list'), ('add_edges_bulk', 'iterable'),
+                               ('remove_nodes', None), ('remove_edges', 'list'))
+
 
     def __init__(self, weighted=False, directed=False) -> None:
         '''
-        Our graph is a dictionary of tuples, in which each node 'u' points to
-        a list of tuples in the form (v, w), where 'v' is a node and 'w' is the
-        the weight of the edge (u, v)
+        Every node label is interned to a dense integer id. _ids maps labels to
+        ids and _labels maps ids back to labels. Our graph is a list indexed by
+        id, in which each node 'u' points to a dictionary mapping every
+        neighbor 'v' to the weight 'w' of the edge (u, v). This makes edge
+        lookups, insertions and removals O(1), and lets searches keep their
+        state in flat arrays. Ids of removed nodes are reused.
+
+        Directed graphs also keep _P, the same structure for incoming edges,
+        so that a node's predecessors are found without scanning every edge
         '''
-        self._G = dict()
+        self._G = []
+        self._P = [] if directed else None
+        self._ids = dict()
+        self._labels = []
+        self._free = []
 
         self._weighted = weighted   # If not weighted, every edge receives weight 1
         self._directed = directed   # If directed, both (u, v) and (v, u) are added to G
 
+        self._version = 0           # Bumped by every change, see BaseGraph.enable_cache
+        self._cache = None
+        self._listeners = []        # Structures kept up to date with the graph, see _notify
+
 
     def get_nodes(self) -> list:
-        return list(self._G.keys())
+        return list(self._ids)
     
 
     def get_edges(self) -> list:
         edges = []
+        labels = self._labels
 
-        for u in self.get_nodes():
-            for v, _ in self.get_adjacency_list(u):
-                edges.append((u, v))
+        for u, i in self._ids.items():
+            for j in self._G[i]:
+                edges.append((u, labels[j]))
         
         return edges
     
 
     def get_adjacency_list(self, node) -> list:
-        if node in self.get_nodes():
-            return self._G[node]
-        else:
-            raise KeyError('{} is not a node of the graph'.format(node))
+        labels = self._labels
+        return [(labels[j], w) for j, w in self._G[self._key(node)].items()]
     
 
     def get_weight(self, edge: tuple):
         u, v = edge
+        adjacency = self._G[self._key(u)]
 
-        for node, weight in self.get_adjacency_list(u):
-            if node == v:
-                return weight
-        
-        raise KeyError('Edge {} is not in the graph'.format((u, v)))
+        j = self._ids.get(v)
+        if j is None or j not in adjacency:
+            raise KeyError('Edge {} is not in the graph'.format((u, v)))
+
+        return adjacency[j]
+
+
+    def has_edge(self, edge: tuple) -> bool:
+        u, v = edge
+        i, j = self._ids.get(u), self._ids.get(v)
+        return i is not None and j is not None and j in self._G[i]
+
+
+    def _has_edges(self) -> bool:
+        # Stops at the first node with a neighbor instead of listing every
+        # edge, freed ids hold None which is falsy like an empty dictionary
+        return any(self._G)
+
+
+    # Storage hooks used by the searches in BaseGraph
+
+    def _node_count(self) -> int:
+        return len(self._ids)
+
+
+    def _node_keys(self):
+        return self._ids.values()
+
+
+    def _capacity(self) -> int:
+        return len(self._labels)
+
+
+    def _key(self, node):
+        try:
+            return self._ids[node]
+        except (KeyError, TypeError):
+            raise KeyError('{} is not a node of the graph'.format(node)) from None
+
+
+    def _label(self, key):
+        return self._labels[key]
+
+
+    def _successors(self, key):
+        return self._G[key]
+
+
+    def _weighted_successors(self, key):
+        return self._G[key].items()
+
+
+    def _weighted_predecessors(self, key):
+        # In an undirected graph, every incoming edge mirrors an outgoing one
+        if self._directed:
+            return self._P[key].items()
+        return self._G[key].items()
+
+
+    def in_degree(self, node) -> int:
+        i = self._key(node)
+        return len(self._P[i] if self._directed else self._G[i])
+
+
+    def freeze(self) -> FrozenGraph:
+        '''
+        Returns an immutable compressed sparse row snapshot of the graph, which
+        answers the same queries using far less memory. Later changes to this
+        graph are not reflected in the snapshot
+        '''
+        G, labels = self._G, self._labels
+        adjacency = ([(labels[j], w) for j, w in G[i].items()] for i in self._ids.values())
+
+        return FrozenGraph(self._ids.keys(), adjacency, weighted=self._weighted, directed=self._directed)
+
+
+    def save(self, path) -> None:
+        '''
+        Writes a frozen snapshot of the graph in a compact binary format,
+        see FrozenGraph.save and Graph.load
+        '''
+        self.freeze().save(path)
+
+
+    @staticmethod
+    def load(path, mmap=True) -> FrozenGraph:
+        '''
+        Reads a graph written by save, as an immutable FrozenGraph. With
+        'mmap', its arrays are read straight from the memory-mapped file, so
+        loading takes no time beyond reading the node labels, and processes
+        loading the same file share its pages
+        '''
+        return binary.load(path, mmap=mmap)
+
+
+    def _notify(self, event, *args) -> None:
+        '''
+        Tells every listener about a change, through one of its methods:
+        _on_edge(i, j, old, new) for each stored edge (i, j), where 'old' is
+        None for a new edge and 'new' is None for a removed one,
+        _on_node_removed(i), and _on_reset() after a bulk load
+        '''
+        for listener in self._listeners:
+            getattr(listener, event)(*args)
+
+
+    def _add_node(self, node) -> int:
+        if self._free:
+            i = self._free.pop()
+            self._labels[i] = node
+            self._G[i] = {}
+            if self._directed:
+                self._P[i] = {}
+        else:
+            i = len(self._labels)
+            self._labels.append(node)
+            self._G.append({})
+            if self._directed:
+                self._P.append({})
+
+        self._ids[node] = i
+        return i
 
 
     def add_nodes(self, nodes) -> None:
@@ -48,9 +219,11 @@ class Graph():
         if not isinstance(nodes, list):
             nodes = [nodes]
 
+        self._version += 1
+
         for node in nodes:
-            if node not in self.get_nodes():
-                self._G[node] = []
+            if node not in self._ids:
+                self._add_node(node)
     
 
     def add_edges(self, edges) -> None:
@@ -58,12 +231,15 @@ class Graph():
         if not isinstance(edges, list):
             edges = [edges]
 
+        self._version += 1
+
         for edge in edges:
             if self._weighted:
                 if len(edge) != 3:
                     raise TypeError('Edges in a weighted graph must be in the form (u, v, w)')
                 
                 u, v, w = edge
+                w = _to_number(w)
             else:
                 if len(edge) != 2:
                     raise TypeError('Edges in an unweighted graph must be in the form (u, v)')
@@ -72,50 +248,184 @@ class Graph():
                 w = 1
             
             # If (u, v) is already in the graph, we override its weight
-            if (u, v) in self.get_edges():
+            if self.has_edge((u, v)):
                 if self._weighted:
-                    self.update_weight((u, v), w)        
-                break
+                    self.update_weight((u, v), w)
+                continue
             
-            # Node 'u' is added do the graph if not existent
-            if u not in self.get_nodes():
-                self.add_nodes(u)
-            self._G[u].append((v, w))
+            # Nodes 'u' and 'v' are added do the graph if not existent
+            i = self._ids.get(u)
+            if i is None:
+                i = self._add_node(u)
+            j = self._ids.get(v)
+            if j is None:
+                j = self._add_node(v)
+            self._G[i][j] = w
 
             # An undirected graph has both edges (u, v) and (v, u)
-            if not self._directed:
-                if v not in self.get_nodes():
-                    self.add_nodes(v)
-                self._G[v].append((u, w))
+            if self._directed:
+                self._P[j][i] = w
+            else:
+                self._G[j][i] = w
+
+            if self._listeners:
+                self._notify('_on_edge', i, j, None, w)
+                if not self._directed and i != j:
+                    self._notify('_on_edge', j, i, None, w)
     
 
+    def add_edges_bulk(self, edges) -> None:
+        '''
+        Adds every edge from any iterable (or generator) of edges in a single
+        pass. The edge form is only checked through tuple unpacking, instead
+        of testing each edge before inserting it, and existing edges have
+        their weight overridden, as in add_edges. Edges given as strings are
+        rejected up front, but a malformed edge found later stops the load
+        with the edges before it already added
+        '''
+        # Strings unpack into their characters, so a list of them, or a single
+        # edge passed by mistake, would be loaded without any error. Checking
+        # the first item catches both once per call
+        edges = iter(edges)
+        first = next(edges, _NO_EDGE)
+        if isinstance(first, (str, bytes)):
+            raise TypeError('Edges must be tuples, got {!r}. Pass a single edge to add_edges, or a list of edges'.format(first))
+        if first is not _NO_EDGE:
+            edges = itertools.chain((first,), edges)
+
+        self._version += 1
+
+        G = self._G
+        # Incoming edges are recorded in _P for directed graphs, and in G
+        # itself for undirected ones
+        P = self._P if self._directed else G
+        ids = self._ids
+        add_node = self._add_node
+
+        try:
+            if self._weighted:
+                for u, v, w in edges:
+                    w = _to_number(w)
+
+                    i = ids.get(u)
+                    if i is None:
+                        i = add_node(u)
+                    j = ids.get(v)
+                    if j is None:
+                        j = add_node(v)
+
+                    G[i][j] = w
+                    P[j][i] = w
+            else:
+                for u, v in edges:
+                    i = ids.get(u)
+                    if i is None:
+                        i = add_node(u)
+                    j = ids.get(v)
+                    if j is None:
+                        j = add_node(v)
+
+                    G[i][j] = 1
+                    P[j][i] = 1
+        except ValueError:
+            if self._weighted:
+                raise TypeError('Edges in a weighted graph must be in the form (u, v, w)') from None
+            raise TypeError('Edges in an unweighted graph must be in the form (u, v)') from None
+        finally:
+            # Listeners rebuild once instead of hearing about every edge
+            if self._listeners:
+                self._notify('_on_reset')
+
+
+    @classmethod
+    def from_edges(cls, edges, weighted=False, directed=False):
+        G = cls(weighted=weighted, directed=directed)
+        G.add_edges_bulk(edges)
+
+        return G
+
+
+    @classmethod
+    def from_scipy_sparse(cls, matrix, nodes=None, weighted=True, directed=True):
+        '''
+        Builds a graph with an edge (i, j) for every stored entry of a SciPy
+        sparse matrix, labelling node i with nodes[i] (or i by default)
+        '''
+        return linalg.from_scipy_sparse(cls, matrix, nodes=nodes, weighted=weighted, directed=directed)
+
+
+    @classmethod
+    def read_edgelist(cls, path, weighted=False, directed=False, delimiter=None, nodetype=None, comments='#', chunk_size=65536):
+        '''
+        Builds a graph from a file listing one edge per line, as "u v" or
+        "u v w", which may be compressed with gzip. Node labels are strings
+        unless 'nodetype' (such as int) is given. The file is streamed
+        'chunk_size' lines at a time, so parsing needs little memory beyond
+        the graph itself
+        '''
+        G = cls(weighted=weighted, directed=directed)
+        read_edgelist(G, path, delimiter=delimiter, nodetype=nodetype, comments=comments, chunk_size=chunk_size)
+
+        return G
+
+
     def update_weight(self, edge: tuple, weight) -> None:
         u, v = edge
+        self._version += 1
+
+        if not self.has_edge((u, v)):
+            raise KeyError('Edge {} is not in the graph'.format((u, v)))
 
-        for i, (node, _) in enumerate(self.get_adjacency_list(u)):
-            if node == v:
-                self._G[u][i] = (node, weight)
+        i, j = self._ids[u], self._ids[v]
+        weight = _to_number(weight)
+        old = self._G[i][j]
+        self._G[i][j] = weight
         
         # Updating the weight for both (u, v) and (v, u) if not directed
-        if not self._directed:
-            for i, (node, _) in enumerate(self.get_adjacency_list(v)):
-                if node == u:
-                    self._G[v][i] = (node, weight)
+        if self._directed:
+            self._P[j][i] = weight
+        else:
+            self._G[j][i] = weight
+
+        if self._listeners:
+            self._notify('_on_edge', i, j, old, weight)
+            if not self._directed and i != j:
+                self._notify('_on_edge', j, i, old, weight)
 
 
     def remove_nodes(self, nodes):
         # If only one node is provided, we turn it into a list
         if not isinstance(nodes, list):
             nodes = [nodes]
+
+        self._version += 1
         
         for node in nodes:
-            if node not in self.get_nodes():
-                raise KeyError('{} is not a node of the graph'.format(node))
+            i = self._key(node)
+            neighbors = self._G[i]
+
+            if self._directed:
+                # Only the node's own outgoing and incoming edges are touched
+                for j in neighbors:
+                    del self._P[j][i]
+                for k in self._P[i]:
+                    if k != i:
+                        del self._G[k][i]
+                self._P[i] = None
             else:
-                del self._G[node]
-                for edge in self.get_edges():
-                    if(node in edge):
-                        self.remove_edges(edge)
+                # In an undirected graph, every incoming edge mirrors an outgoing one
+                for j in neighbors:
+                    if j != i:
+                        del self._G[j][i]
+
+            # The id of the removed node is freed to be reused
+            del self._ids[node]
+            self._G[i] = None
+            self._labels[i] = _FREE
+            self._free.append(i)
+
+            if self._listeners:
+                self._notify('_on_node_removed', i)
 
     
     
@@ -123,113 +433,25 @@ class Graph():
         # If only one edge is provided, we turn it into a list
         if not isinstance(edges, list):
             edges = [edges]
+
+        self._version += 1
         
         for edge in edges:
             u, v = edge
 
-            if edge not in self.get_edges():
+            if not self.has_edge((u, v)):
                 raise KeyError('Edge {} is not in the graph'.format((u, v)))
             
-            for node, weight in self.get_adjacency_list(u):
-                if node == v:
-                    self._G[u].remove((node, weight))
+            i, j = self._ids[u], self._ids[v]
+            weight = self._G[i].pop(j)
             
             # Removing both (u, v) and (v, u) if not directed
-            if not self._directed:
-                for node, weight in self.get_adjacency_list(v):
-                    if node == u:
-                        self._G[v].remove((node, weight))
-
-    def breadth_first_search(self, goal, start=None, get_path=True):
-        if len(self.get_nodes()) == 0:
-            raise KeyError('Graph has no nodes')
-
-        if len(self.get_edges()) == 0:
-            raise KeyError('Graph has no edges')
-
-        if start == None:
-            start=self.get_nodes()[0][0]
-
-        visited = []
-        queue = []
-
-        queue.append(start)
-
-        while len(queue) > 0:
-            node = queue.pop(0)
-
-            visited.append(node)
-
-            if node == goal:
-                if get_path:
-                    return (True, visited)
-                return True
-
-            for neighbor in self.get_adjacency_list(node):
-                if neighbor[0] not in visited and neighbor[0] not in queue:
-                    queue.append(neighbor[0])
-
-        if get_path:
-            return (False, [])
-        return False
-
-    def depth_first_search(self, goal, start=None, get_path=True):
-        if len(self.get_nodes()) == 0:
-            raise KeyError('Graph has no nodes')
-
-        if len(self.get_edges()) == 0:
-            raise KeyError('Graph has no edges')
-
-        if start == None:
-            start=self.get_nodes()[0][0]
-
-        stack = []
-        stack.append(start)
-        visited = []
-
-        while len(stack) > 0:
-            node = stack.pop()
-
-            visited.append(node)
-
-            if node == goal:
-                if get_path:
-                    return (True, visited)
-                return True
-
-            for neighbor in self.get_adjacency_list(node):
-                if neighbor[0] not in visited and neighbor[0] not in stack:
-                    stack.append(neighbor[0])
-
-        if get_path:
-            return (False, [])
-        return False
-
-    def uniform_cost_search(self, goal, start=None):
-        if len(self.get_nodes()) == 0:
-            raise KeyError('Graph has no nodes')
-
-        if len(self.get_edges()) == 0:
-            raise KeyError('Graph has no edges')
-
-        if start == None:
-            start=self.get_nodes()[0][0]
-
-        queue = []
-        visited = {}
-        queue.append([0, start])
-
-        while (len(queue) > 0):
-
-            queue = sorted(queue)
-            node = queue[0]
-            del queue[0]
-            if (node[1] == goal):
-                answer = node[0]
-                return (True, answer)
-            if (node[1] not in visited):
-                for new_node in self.get_adjacency_list(node[1]):
-                    queue.append([(node[0] + int(new_node[1])), new_node[0]])
-            visited[node[1]] = 1
-
-        return (False, [])
+            if self._directed:
+                del self._P[j][i]
+            elif i != j:
+                del self._G[j][i]
+
+            if self._listeners:
+                self._notify('_on_edge', i, j, weight, None)
+                if not self._directed and i != j:
+                    self._notify('_on_edge', j, i, weight, None)
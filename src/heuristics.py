@@ -0,0 +1,42 @@
+'''
+Heuristics for Graph.a_star. Each function returns a callable h(node, goal)
+estimating the distance between two nodes from their coordinates. These
+estimates never exceed the real distance as long as every edge weight is
+at least the distance between its endpoints under the same metric.
+'''
+import math
+
+
+def _coordinates_of(positions):
+    # Without a mapping, nodes are taken to be coordinate tuples themselves
+    if positions is None:
+        return lambda node: node
+    if callable(positions):
+        return positions
+    return positions.__getitem__
+
+
+def euclidean(positions=None, scale=1):
+    '''
+    Straight line distance, times 'scale'. 'positions' maps each node to its
+    coordinates, as a dictionary or a function
+    '''
+    coordinates = _coordinates_of(positions)
+
+    def heuristic(node, goal):
+        return scale * math.sqrt(sum((a - b) ** 2 for a, b in zip(coordinates(node), coordinates(goal))))
+
+    return heuristic
+
+
+def manhattan(positions=None, scale=1):
+    '''
+    Sum of the distances along each axis, times 'scale', suited to grids
+    where moves follow the axes
+    '''
+    coordinates = _coordinates_of(positions)
+
+    def heuristic(node, goal):
+        return scale * sum(abs(a - b) for a, b in zip(coordinates(node), coordinates(goal)))
+
+    return heuristic
@@ -0,0 +1,294 @@
+'''
+NumPy and SciPy interoperability. Both are optional: they are imported when
+one of these functions is first called, which raises ImportError when the
+package is not installed.
+
+Every function works on the compressed sparse row arrays of a FrozenGraph
+(Graph instances are frozen first), which NumPy views without copying, and
+builds its result in whole-array operations. Rows and columns follow the
+order of get_nodes().
+'''
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('This operation requires numpy, install it with "pip install numpy"') from None
+    return numpy
+
+
+def _scipy_sparse():
+    try:
+        import scipy.sparse
+    except ImportError:
+        raise ImportError('This operation requires scipy, install it with "pip install scipy"') from None
+    return scipy.sparse
+
+
+_DTYPES = {'i': 'int32', 'q': 'int64', 'd': 'float64'}
+
+
+def _csr(graph):
+    '''
+    Returns the node labels and the (offsets, targets, weights) NumPy arrays,
+    with weights of one in unweighted graphs
+    '''
+    np = _numpy()
+    from .csr import _typecode
+
+    if hasattr(graph, 'freeze'):
+        graph = graph.freeze()
+
+    offsets = np.frombuffer(graph._offsets, dtype=np.int64)
+    targets = np.frombuffer(graph._targets, dtype=_DTYPES[_typecode(graph._targets)])
+
+    if graph._weights is None:
+        weights = np.ones(len(targets))
+    else:
+        weights = np.frombuffer(graph._weights, dtype=_DTYPES[_typecode(graph._weights)])
+
+    return graph._labels, offsets, targets, weights
+
+
+def _sources(np, n, offsets):
+    # Row of every edge, the expanded form of the offsets
+    return np.repeat(np.arange(n), np.diff(offsets))
+
+
+def to_numpy_matrix(graph, nonedge=0.0, dtype=float):
+    '''
+    Dense adjacency matrix holding the weight of each edge, and 'nonedge'
+    where there is no edge
+    '''
+    np = _numpy()
+    labels, offsets, targets, weights = _csr(graph)
+    n = len(labels)
+
+    matrix = np.full((n, n), nonedge, dtype=dtype)
+    matrix[_sources(np, n, offsets), targets] = weights
+
+    return matrix
+
+
+def to_scipy_sparse(graph, format='csr'):
+    '''
+    Sparse adjacency matrix of edge weights, built directly from the CSR
+    arrays and converted to any other SciPy 'format', such as 'coo'
+    '''
+    sparse = _scipy_sparse()
+    labels, offsets, targets, weights = _csr(graph)
+    n = len(labels)
+
+    matrix = sparse.csr_matrix((weights, targets, offsets), shape=(n, n))
+    return matrix.asformat(format)
+
+
+def from_scipy_sparse(cls, matrix, nodes=None, weighted=True, directed=True):
+    '''
+    Builds a graph of class 'cls' with an edge (i, j) for every stored entry
+    of the SciPy sparse 'matrix', labelled by 'nodes' (0..n-1 by default)
+    '''
+    coo = matrix.tocoo()
+    n = coo.shape[0]
+
+    if coo.shape[0] != coo.shape[1]:
+        raise ValueError('Adjacency matrices must be square, got shape {}'.format(coo.shape))
+
+    labels = list(range(n)) if nodes is None else list(nodes)
+    if len(labels) != n:
+        raise ValueError('Expected {} node labels, got {}'.format(n, len(labels)))
+
+    rows, columns = coo.row.tolist(), coo.col.tolist()
+
+    G = cls(weighted=weighted, directed=directed)
+    G.add_nodes(labels)
+
+    if weighted:
+        G.add_edges_bulk(zip([labels[i] for i in rows], [labels[j] for j in columns], coo.data.tolist()))
+    else:
+        G.add_edges_bulk(zip([labels[i] for i in rows], [labels[j] for j in columns]))
+
+    return G
+
+
+def degree_vector(graph, direction='out', weighted=False):
+    '''
+    Number of edges leaving ('out') or entering ('in') each node, or the sum
+    of their weights when 'weighted' is set
+    '''
+    np = _numpy()
+    labels, offsets, targets, weights = _csr(graph)
+    n = len(labels)
+
+    if direction == 'out':
+        if not weighted:
+            return np.diff(offsets)
+        return np.bincount(_sources(np, n, offsets), weights=weights, minlength=n)
+
+    if direction == 'in':
+        return np.bincount(targets, weights=weights if weighted else None, minlength=n)
+
+    raise ValueError("Direction must be 'out' or 'in', got {!r}".format(direction))
+
+
+def pagerank(graph, alpha=0.85, tol=1e-10, max_iter=100, weighted=True):
+    '''
+    PageRank by power iteration, mapping each node to its score. Each step is
+    one vectorized sparse product. Nodes without outgoing edges spread their
+    score evenly over every node
+    '''
+    np = _numpy()
+    labels, offsets, targets, weights = _csr(graph)
+    n = len(labels)
+
+    if n == 0:
+        return {}
+
+    sources = _sources(np, n, offsets)
+    if not weighted:
+        weights = np.ones(len(targets))
+
+    strength = np.bincount(sources, weights=weights, minlength=n)
+    dangling = strength == 0
+    # Share of a source's score carried by each of its edges
+    shares = weights / np.where(dangling, 1, strength)[sources]
+
+    scores = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        spread = np.bincount(targets, weights=scores[sources] * shares, minlength=n)
+        new_scores = alpha * (spread + scores[dangling].sum() / n) + (1 - alpha) / n
+
+        converged = np.abs(new_scores - scores).sum() < n * tol
+        scores = new_scores
+        if converged:
+            break
+
+    return dict(zip(labels, scores.tolist()))
+
+
+# Rows of the matrix updated together by the blocked Floyd-Warshall, sized so
+# that a stripe of rows stays in the CPU cache
+_BLOCK = 64
+
+# Estimated cost of one Floyd-Warshall cell update relative to one edge
+# relaxation of a Dijkstra run in Python, from benchmarks
+_CELL_COST = 1 / 400
+
+
+def all_pairs_shortest_paths(graph, method='auto', next_hops=False):
+    '''
+    Matrix of shortest distances between every pair of nodes, infinite when
+    unreachable, as a float64 NumPy array. With 'next_hops', also returns a
+    matrix holding the index of the node following i on a shortest path to
+    j, or -1 when there is none. 'method' is 'floyd_warshall', 'dijkstra' or
+    'auto', which estimates the cost of both from the number of edges
+    '''
+    np = _numpy()
+    if hasattr(graph, 'freeze'):
+        graph = graph.freeze()
+
+    labels, offsets, targets, weights = _csr(graph)
+    n = len(labels)
+
+    if method == 'auto':
+        # Floyd-Warshall costs n^3 cell updates, n Dijkstra runs n * (m + n)
+        # relaxations, and only Floyd-Warshall handles negative weights
+        negative = len(weights) > 0 and weights.min() < 0
+        dense = n * n * _CELL_COST <= len(targets) + n
+        method = 'floyd_warshall' if negative or dense else 'dijkstra'
+
+    if method == 'floyd_warshall':
+        distances, hops = _floyd_warshall(np, n, offsets, targets, weights, next_hops)
+    elif method == 'dijkstra':
+        distances, hops = _repeated_dijkstra(np, graph, n, next_hops)
+    else:
+        raise ValueError("Method must be 'auto', 'floyd_warshall' or 'dijkstra', got {!r}".format(method))
+
+    return (distances, hops) if next_hops else distances
+
+
+def _repeated_dijkstra(np, graph, n, next_hops):
+    from .base import _DijkstraState
+
+    distances = np.empty((n, n))
+    hops = np.full((n, n), -1, dtype=np.int64) if next_hops else None
+    state = _DijkstraState(n)
+
+    for source in range(n):
+        graph._run_dijkstra(state, [source])
+        distances[source] = state.distances
+
+        if next_hops:
+            # Nodes are settled after their parents, whose next hop they share
+            parents, row = state.parents, [-1] * n
+            for node in state.order:
+                parent = parents[node]
+                row[node] = node if parent == source else row[parent]
+            row[source] = source
+            hops[source] = row
+
+        state.reset()
+
+    return distances, hops
+
+
+def _relax(np, target, target_hops, left, right, left_hops):
+    # Every path i -> k -> j with k a column of 'left' and a row of 'right'
+    candidates = np.empty_like(target)
+
+    for k in range(left.shape[1]):
+        np.add(left[:, k, None], right[None, k, :], out=candidates)
+
+        if target_hops is None:
+            np.minimum(target, candidates, out=target)
+        else:
+            shorter = candidates < target
+            np.copyto(target, candidates, where=shorter)
+            np.copyto(target_hops, left_hops[:, k, None], where=shorter)
+
+
+def _floyd_warshall(np, n, offsets, targets, weights, next_hops):
+    '''
+    Blocked Floyd-Warshall. For each block of _BLOCK intermediate nodes, the
+    block itself is solved first, then its rows and columns, and then the
+    rest of the matrix one stripe of rows at a time, so each stripe is
+    updated by the whole block while it is in the cache
+    '''
+    sources = _sources(np, n, offsets)
+    distances = np.full((n, n), np.inf)
+    # Parallel edges cannot occur, so plain assignment keeps every weight
+    distances[sources, targets] = weights
+    np.fill_diagonal(distances, np.minimum(distances.diagonal(), 0))
+
+    hops = None
+    if next_hops:
+        hops = np.full((n, n), -1, dtype=np.int64)
+        hops[sources, targets] = targets
+        np.fill_diagonal(hops, np.arange(n))
+
+    for start in range(0, n, _BLOCK):
+        end = min(start + _BLOCK, n)
+        block = slice(start, end)
+
+        diagonal = distances[block, block]
+        diagonal_hops = None if hops is None else hops[block, block]
+        _relax(np, diagonal, diagonal_hops, diagonal, diagonal, diagonal_hops)
+
+        rows, columns = distances[block, :], distances[:, block]
+        row_hops = None if hops is None else hops[block, :]
+        column_hops = None if hops is None else hops[:, block]
+        _relax(np, rows, row_hops, diagonal, rows, diagonal_hops)
+        _relax(np, columns, column_hops, columns, diagonal, column_hops)
+
+        # Copies, as the stripes below overlap them
+        rows, columns = rows.copy(), columns.copy()
+        if hops is not None:
+            column_hops = column_hops.copy()
+
+        for stripe in range(0, n, _BLOCK):
+            stripe = slice(stripe, stripe + _BLOCK)
+            _relax(np, distances[stripe], None if hops is None else hops[stripe], columns[stripe], rows,
+                   None if hops is None else column_hops[stripe])
+
+    return distances, hops
@@ -0,0 +1,134 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Snapshot of the graph held by each worker process, set once by _init_worker
+_graph = None
+
+
+def _init_worker(graph) -> None:
+    global _graph
+    _graph = graph
+
+
+def _bfs_depths(max_depth, sources):
+    return [(source, {node: depth for node, depth, _ in _graph.iter_bfs(source, max_depth)}) for source in sources]
+
+
+def _shortest_paths(groups):
+    return [(source, targets, _graph.shortest_paths_many([source], targets)[0]) for source, targets in groups]
+
+
+def _map_nodes(func, nodes):
+    return [(node, func(_graph, node)) for node in nodes]
+
+
+def _is_node(graph, node) -> bool:
+    try:
+        graph._key(node)
+    except KeyError:
+        return False
+    return True
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class ParallelExecutor():
+
+    def __init__(self, graph, workers=None, chunk_size=None) -> None:
+        '''
+        Runs independent per-source queries over a pool of worker processes.
+        The graph is frozen (see Graph.freeze) and sent to each worker only
+        once, when the worker starts, so tasks carry nothing but node labels.
+        Use it as a context manager, or call close() when done.
+        Requires Python 3.7 or newer
+        '''
+        if hasattr(graph, 'freeze'):
+            graph = graph.freeze()
+
+        self._graph = graph
+        self._workers = workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._pool = ProcessPoolExecutor(max_workers=self._workers, initializer=_init_worker, initargs=(graph,))
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+    def close(self) -> None:
+        self._pool.shutdown()
+
+
+    def _run(self, func, items, *args) -> list:
+        # Tasks get the arguments followed by a chunk of items. A few chunks
+        # per worker balance the load without many round trips
+        size = self._chunk_size or max(1, len(items) // (self._workers * 4))
+        futures = [self._pool.submit(func, *(args + (chunk,))) for chunk in _chunks(items, size)]
+
+        results = []
+        for future in futures:
+            results.extend(future.result())
+
+        return results
+
+
+    def bfs_all(self, sources=None, max_depth=None) -> dict:
+        '''
+        Maps every source (all nodes by default) to a dictionary holding the
+        depth, in edges, of each node reachable from it
+        '''
+        if sources is None:
+            sources = self._graph.get_nodes()
+
+        results = self._run(_bfs_depths, list(sources), max_depth)
+        return dict(results)
+
+
+    def uniform_cost_search_many(self, pairs) -> list:
+        '''
+        Answers uniform_cost_search for every (goal, start) pair, in order.
+        Pairs sharing a start are answered by a single Dijkstra run
+        '''
+        graph = self._graph
+        pairs = list(pairs)
+        # Starts are checked here as uniform_cost_search does, which also
+        # replaces a missing start with the first node
+        starts = {start: graph._label(graph._check_search(start)) for _, start in pairs}
+
+        groups = {}
+        for goal, start in pairs:
+            if _is_node(graph, goal):
+                groups.setdefault(starts[start], set()).add(goal)
+
+        distances = {}
+        tasks = [(source, list(targets)) for source, targets in groups.items()]
+        for source, targets, row in self._run(_shortest_paths, tasks):
+            for target, distance in zip(targets, row):
+                distances[(target, source)] = distance
+
+        results = []
+        for goal, start in pairs:
+            # Goals that are not nodes of the graph are never reached
+            distance = distances.get((goal, starts[start]), float('inf'))
+            results.append((True, distance) if distance != float('inf') else (False, []))
+
+        return results
+
+
+    def map_nodes(self, func, nodes=None) -> dict:
+        '''
+        Maps every node (all of them by default) to func(graph, node), where
+        'func' must be a module level function so that it can be pickled
+        '''
+        if nodes is None:
+            nodes = self._graph.get_nodes()
+
+        return dict(self._run(_map_nodes, list(nodes), func))
@@ -0,0 +1,251 @@
+'''
+Opt-in instrumentation of searches and mutations, see Graph.enable_stats.
+
+Nothing here is on the normal code paths. Enabling stats installs wrappers
+on the graph instance itself, shadowing its public methods and the storage
+and heap hooks that searches look up once per call. Disabling removes them,
+so a graph without stats runs exactly the code it would otherwise run.
+'''
+import asyncio
+import functools
+import heapq
+from time import perf_counter
+
+
+_COUNTERS = ('nodes_expanded', 'edges_relaxed', 'peak_frontier', 'heap_pushes', 'nodes_changed', 'edges_changed')
+
+# Hooks counting the work of a search, see _counting_hook
+_HOOKS = ('_successors', '_weighted_successors', '_weighted_predecessors')
+
+
+class CallStats():
+
+    def __init__(self, operation) -> None:
+        '''
+        Counters of one call. Searches count the nodes whose edges they
+        scanned (nodes_expanded), those edges (edges_relaxed), the largest
+        queue, stack or heap they kept (peak_frontier) and their heap pushes.
+        Mutations count the nodes added or removed and the edges they were
+        given. Wall time is in seconds
+        '''
+        self.operation = operation
+        self.seconds = 0.0
+        self.nodes_expanded = 0
+        self.edges_relaxed = 0
+        self.peak_frontier = 0
+        self.heap_pushes = 0
+        self.nodes_changed = 0
+        self.edges_changed = 0
+
+        self._frontier = None
+
+
+    def __repr__(self) -> str:
+        return 'CallStats({})'.format(', '.join('{}={!r}'.format(name, value) for name, value in self.as_dict().items()))
+
+
+    def as_dict(self) -> dict:
+        result = {'operation': self.operation, 'seconds': self.seconds}
+        for name in _COUNTERS:
+            result[name] = getattr(self, name)
+
+        return result
+
+
+    def watch(self, frontier) -> None:
+        # Searches hand over their queue, stack or heap once, when created
+        self._frontier = frontier
+        self._sample()
+
+
+    def _sample(self) -> None:
+        if self._frontier is not None and len(self._frontier) > self.peak_frontier:
+            self.peak_frontier = len(self._frontier)
+
+
+class Stats():
+
+    def __init__(self, callback=None) -> None:
+        '''
+        Collects the CallStats of every instrumented call, keeping the last
+        one and running totals per operation. 'callback', if given, receives
+        each CallStats as soon as its call returns
+        '''
+        self.callback = callback
+        self.last = None
+        self._totals = {}
+
+
+    def record(self, call) -> None:
+        self.last = call
+
+        totals = self._totals.get(call.operation)
+        if totals is None:
+            totals = self._totals[call.operation] = dict.fromkeys(('calls', 'seconds') + _COUNTERS, 0)
+
+        totals['calls'] += 1
+        totals['seconds'] += call.seconds
+        for name in _COUNTERS:
+            if name == 'peak_frontier':
+                totals[name] = max(totals[name], call.peak_frontier)
+            else:
+                totals[name] += getattr(call, name)
+
+        if self.callback is not None:
+            self.callback(call)
+
+
+    def totals(self) -> dict:
+        '''
+        Maps each operation to its number of calls and the sum of their time
+        and counters, except for peak_frontier, which is the largest seen
+        '''
+        return {operation: dict(totals) for operation, totals in self._totals.items()}
+
+
+    def reset(self) -> None:
+        self.last = None
+        self._totals.clear()
+
+
+class _CountedEdges():
+    '''
+    Edges returned by a counting hook. It behaves as the list of edges for
+    len(), truth tests and indexing, so callers see the same values as with
+    stats off, and counts each edge as it is iterated
+    '''
+
+    __slots__ = ('_edges', '_call')
+
+    def __init__(self, edges, call) -> None:
+        self._edges = edges
+        self._call = call
+
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+
+    def __getitem__(self, index):
+        return self._edges[index]
+
+
+    def __iter__(self):
+        call = self._call
+        for edge in self._edges:
+            call.edges_relaxed += 1
+            yield edge
+        # The caller has handled every edge, so the frontier is at its largest
+        call._sample()
+
+
+def _counting_hook(hook, call):
+    # Each call expands one node, and every edge taken from it is relaxed
+    def counted(key):
+        call.nodes_expanded += 1
+        return _CountedEdges(list(hook(key)), call)
+
+    return counted
+
+
+def _counting_heappush(call):
+    def heappush(heap, item):
+        call.heap_pushes += 1
+        heapq.heappush(heap, item)
+
+    return heappush
+
+
+def _wrap_search(graph, method, stats):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        # Searches run by another search count towards the outer call
+        if graph._probe is not None:
+            return method(*args, **kwargs)
+
+        call = CallStats(method.__name__)
+        hooks = {name: getattr(graph, name) for name in _HOOKS}
+        for name, hook in hooks.items():
+            setattr(graph, name, _counting_hook(hook, call))
+        graph._heappush = _counting_heappush(call)
+        graph._probe = call
+
+        def finish():
+            call.seconds = perf_counter() - started
+            call._frontier = None
+            stats.record(call)
+
+        started = perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        except BaseException:
+            finish()
+            raise
+        finally:
+            for name in _HOOKS + ('_heappush', '_probe'):
+                del graph.__dict__[name]
+
+        # Coroutines keep the counting hooks they were given, and are
+        # recorded once they complete
+        if asyncio.iscoroutine(result):
+            return _recorded(result, finish)
+
+        finish()
+        return result
+
+    return wrapper
+
+
+async def _recorded(coroutine, finish):
+    try:
+        return await coroutine
+    finally:
+        finish()
+
+
+def _counted(items, call):
+    for item in items:
+        call.edges_changed += 1
+        yield item
+
+
+def _wrap_mutation(graph, method, stats, edges):
+    # 'edges' tells how the argument holds edges: None when it holds nodes,
+    # 'list' for one edge or a list of them, 'iterable' for any iterable
+    @functools.wraps(method)
+    def wrapper(items):
+        call = CallStats(method.__name__)
+
+        if edges is not None:
+            if isinstance(items, list):
+                call.edges_changed = len(items)
+            elif edges == 'list':
+                call.edges_changed = 1
+            else:
+                # Counted as they are consumed, so generators still stream
+                items = _counted(items, call)
+        nodes = graph._node_count()
+
+        started = perf_counter()
+        try:
+            return method(items)
+        finally:
+            call.seconds = perf_counter() - started
+            call.nodes_changed = abs(graph._node_count() - nodes)
+            stats.record(call)
+
+    return wrapper
+
+
+def enable(graph, stats) -> None:
+    disable(graph)
+
+    for name in graph._instrumented_searches:
+        setattr(graph, name, _wrap_search(graph, getattr(graph, name), stats))
+    for name, edges in graph._instrumented_mutations:
+        setattr(graph, name, _wrap_mutation(graph, getattr(graph, name), stats, edges))
+
+
+def disable(graph) -> None:
+    for name in graph._instrumented_searches + tuple(name for name, _ in graph._instrumented_mutations):
+        graph.__dict__.pop(name, None)
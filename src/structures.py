@@ -0,0 +1,163 @@
+class UnionFind():
+
+    def __init__(self, size=0) -> None:
+        '''
+        Disjoint sets over the integers 0..size-1, with union by size and
+        path halving, so every operation takes nearly constant time
+        '''
+        self._parents = list(range(size))
+        self._sizes = [1] * size
+        self.count = size   # Number of disjoint sets
+
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+
+    def grow(self, size) -> None:
+        # New elements start in sets of their own
+        for x in range(len(self._parents), size):
+            self._parents.append(x)
+            self._sizes.append(1)
+            self.count += 1
+
+
+    def find(self, x) -> int:
+        parents = self._parents
+
+        while parents[x] != x:
+            parents[x] = parents[parents[x]]
+            x = parents[x]
+
+        return x
+
+
+    def union(self, a, b) -> bool:
+        '''
+        Joins the sets of 'a' and 'b', returning False if they were already
+        the same set
+        '''
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+
+        if self._sizes[a] < self._sizes[b]:
+            a, b = b, a
+        self._parents[b] = a
+        self._sizes[a] += self._sizes[b]
+        self.count -= 1
+
+        return True
+
+
+    def connected(self, a, b) -> bool:
+        return self.find(a) == self.find(b)
+
+
+    def set_size(self, x) -> int:
+        return self._sizes[self.find(x)]
+
+
+class IndexedHeap():
+
+    def __init__(self) -> None:
+        '''
+        Binary min-heap of keys ordered by priority, which also knows where
+        each key is stored, so the priority of a key already in the heap can
+        be lowered (decrease-key) in O(log n) instead of pushing it again.
+        Keys may be any hashable values
+        '''
+        self._heap = []          # (priority, key) pairs
+        self._positions = {}     # key -> index in _heap
+
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+    def __contains__(self, key) -> bool:
+        return key in self._positions
+
+
+    def priority(self, key):
+        return self._heap[self._positions[key]][0]
+
+
+    def peek(self) -> tuple:
+        priority, key = self._heap[0]
+        return key, priority
+
+
+    def push(self, key, priority) -> bool:
+        '''
+        Adds 'key', or lowers its priority if it is already in the heap.
+        Returns whether the heap changed
+        '''
+        position = self._positions.get(key)
+
+        if position is None:
+            self._heap.append((priority, key))
+            self._positions[key] = len(self._heap) - 1
+            self._sift_up(len(self._heap) - 1)
+            return True
+
+        if priority < self._heap[position][0]:
+            self._heap[position] = (priority, key)
+            self._sift_up(position)
+            return True
+
+        return False
+
+
+    def pop(self) -> tuple:
+        '''
+        Removes and returns the (key, priority) with the lowest priority
+        '''
+        heap = self._heap
+        priority, key = heap[0]
+        del self._positions[key]
+
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            self._positions[last[1]] = 0
+            self._sift_down(0)
+
+        return key, priority
+
+
+    def _sift_up(self, position) -> None:
+        heap, positions = self._heap, self._positions
+        item = heap[position]
+
+        while position > 0:
+            parent = (position - 1) >> 1
+            if not item[0] < heap[parent][0]:
+                break
+            heap[position] = heap[parent]
+            positions[heap[position][1]] = position
+            position = parent
+
+        heap[position] = item
+        positions[item[1]] = position
+
+
+    def _sift_down(self, position) -> None:
+        heap, positions = self._heap, self._positions
+        size = len(heap)
+        item = heap[position]
+
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1][0] < heap[child][0]:
+                child += 1
+            if not heap[child][0] < item[0]:
+                break
+            heap[position] = heap[child]
+            positions[heap[position][1]] = position
+            position = child
+
+        heap[position] = item
+        positions[item[1]] = position
@@ -0,0 +1,239 @@
+'''
+Read-only views of a graph. A view answers every BaseGraph query through the
+storage hooks of the graph it wraps, filtering nodes and edges as they are
+visited, so creating one copies no adjacency and later changes to the graph
+show through. Views share the node ids of their graph, and may be nested.
+'''
+from .base import BaseGraph
+from .csr import FrozenGraph
+
+
+class GraphView(BaseGraph):
+
+    def __init__(self, graph) -> None:
+        '''
+        A view showing all of 'graph'. Subclasses override the hooks of
+        whatever they filter
+        '''
+        self._graph = graph
+        self._weighted = graph._weighted
+        self._directed = graph._directed
+        self._connectivity_state = (None, None)
+
+
+    @property
+    def _version(self) -> int:
+        # Cached results of the view are dropped whenever the graph changes
+        return self._graph._version
+
+
+    @property
+    def _connectivity(self):
+        index, version = self._connectivity_state
+        return index if version == self._version else None
+
+
+    @_connectivity.setter
+    def _connectivity(self, index) -> None:
+        self._connectivity_state = (index, self._version)
+
+
+    def freeze(self) -> FrozenGraph:
+        '''
+        Copies what the view shows into an immutable FrozenGraph
+        '''
+        label = self._label
+        adjacency = ([(label(v), w) for v, w in self._weighted_successors(key)] for key in self._node_keys())
+
+        return FrozenGraph(self.get_nodes(), adjacency, weighted=self._weighted, directed=self._directed)
+
+
+    # Storage hooks, passed through to the graph
+
+    def _node_count(self) -> int:
+        return self._graph._node_count()
+
+
+    def _node_keys(self):
+        return self._graph._node_keys()
+
+
+    def _capacity(self) -> int:
+        return self._graph._capacity()
+
+
+    def _key(self, node):
+        return self._graph._key(node)
+
+
+    def _label(self, key):
+        return self._graph._label(key)
+
+
+    def _successors(self, key):
+        return self._graph._successors(key)
+
+
+    def _weighted_successors(self, key):
+        return self._graph._weighted_successors(key)
+
+
+    def _weighted_predecessors(self, key):
+        return self._graph._weighted_predecessors(key)
+
+
+    def _has_edges(self) -> bool:
+        return self._graph._has_edges()
+
+
+    def get_weight(self, edge: tuple):
+        return self._graph.get_weight(edge)
+
+
+class SubgraphView(GraphView):
+
+    def __init__(self, graph, nodes) -> None:
+        '''
+        The nodes in 'nodes' and the edges between them. Nodes later removed
+        from the graph leave the view too
+        '''
+        super().__init__(graph)
+
+        self._nodes = list(dict.fromkeys(nodes))
+        for node in self._nodes:
+            graph._key(node)
+
+        self._members_state = (None, None)
+
+
+    def _members(self):
+        # Keys of the nodes, recomputed after changes since ids get reused
+        keys, version = self._members_state
+
+        if version != self._version:
+            keys = {}
+            for node in self._nodes:
+                try:
+                    keys[self._graph._key(node)] = None
+                except KeyError:
+                    pass
+            self._members_state = (keys, self._version)
+
+        return keys
+
+
+    def _node_count(self) -> int:
+        return len(self._members())
+
+
+    def _node_keys(self):
+        return iter(self._members())
+
+
+    def _key(self, node):
+        key = self._graph._key(node)
+        if key not in self._members():
+            raise KeyError('{} is not a node of the graph'.format(node))
+        return key
+
+
+    def _successors(self, key):
+        members = self._members()
+        return [v for v in self._graph._successors(key) if v in members]
+
+
+    def _weighted_successors(self, key):
+        members = self._members()
+        return [(v, w) for v, w in self._graph._weighted_successors(key) if v in members]
+
+
+    def _weighted_predecessors(self, key):
+        members = self._members()
+        return [(u, w) for u, w in self._graph._weighted_predecessors(key) if u in members]
+
+
+    def _has_edges(self) -> bool:
+        return any(self._successors(key) for key in self._members())
+
+
+    def get_weight(self, edge: tuple):
+        u, v = edge
+        self._key(u)
+        self._key(v)
+
+        return self._graph.get_weight(edge)
+
+
+class EdgeFilteredView(GraphView):
+
+    def __init__(self, graph, predicate) -> None:
+        '''
+        Every node, and the edges (u, v) with weight w for which
+        predicate(u, v, w) is true. An undirected edge is always tested with
+        its two ends in the same order, so both of its directions are kept or
+        dropped together
+        '''
+        super().__init__(graph)
+        self._predicate = predicate
+
+
+    def _keep(self, i, j, w) -> bool:
+        if not self._directed and j < i:
+            i, j = j, i
+
+        label = self._graph._label
+        return bool(self._predicate(label(i), label(j), w))
+
+
+    def _successors(self, key):
+        keep = self._keep
+        return [v for v, w in self._graph._weighted_successors(key) if keep(key, v, w)]
+
+
+    def _weighted_successors(self, key):
+        keep = self._keep
+        return [(v, w) for v, w in self._graph._weighted_successors(key) if keep(key, v, w)]
+
+
+    def _weighted_predecessors(self, key):
+        keep = self._keep
+        return [(u, w) for u, w in self._graph._weighted_predecessors(key) if keep(u, key, w)]
+
+
+    def _has_edges(self) -> bool:
+        return any(self._successors(key) for key in self._node_keys())
+
+
+    def get_weight(self, edge: tuple):
+        u, v = edge
+        w = self._graph.get_weight(edge)
+
+        if not self._keep(self._key(u), self._key(v), w):
+            raise KeyError('Edge {} is not in the graph'.format((u, v)))
+        return w
+
+
+class ReverseView(GraphView):
+
+    def __init__(self, graph) -> None:
+        '''
+        The graph with every edge (u, v) turned into (v, u)
+        '''
+        super().__init__(graph)
+
+
+    def _successors(self, key):
+        return [u for u, _ in self._graph._weighted_predecessors(key)]
+
+
+    def _weighted_successors(self, key):
+        return self._graph._weighted_predecessors(key)
+
+
+    def _weighted_predecessors(self, key):
+        return self._graph._weighted_successors(key)
+
+
+    def get_weight(self, edge: tuple):
+        u, v = edge
+        return self._graph.get_weight((v, u))
@@ -0,0 +1,129 @@
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import src.graphex as gx
+
+
+class TestAsyncSearches(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+        self.weighted_G = gx.Graph(weighted=True)
+        self.weighted_G.add_edges([("A", "T", "118"), ("T", "L", "111"), ("M", "L", "70"), ("M", "D", "75"), ("D", "C", "120"), ("C", "R", "146"), ("C", "P", "138"),
+                          ("R", "S", "80"), ("A", "S", "140"), ("S", "F", "99"), ("R", "P", "97"), ("P", "B", "101"), ("B", "G", "90"), ("F", "B", "211")])
+
+        self.path_G = gx.Graph.from_edges([(i, i + 1, 1) for i in range(500)], weighted=True)
+
+
+    def tearDown(self):
+        self.loop.close()
+
+
+    def run_until_complete(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+
+    def test_same_results_as_synchronous_searches(self):
+        G = self.weighted_G
+
+        for goal in ("B", "G", "Z"):
+            self.assertEqual(self.run_until_complete(G.abfs(goal, start="D", yield_every=2)), G.breadth_first_search(goal, start="D"))
+            self.assertEqual(self.run_until_complete(G.abfs(goal, start="D", get_path=False)), G.breadth_first_search(goal, start="D", get_path=False))
+            self.assertEqual(self.run_until_complete(G.adijkstra("D", goal, yield_every=2)), G.dijkstra("D", goal))
+
+        self.assertEqual(self.run_until_complete(G.freeze().adijkstra("A")), G.dijkstra("A"))
+
+
+    def test_yields_to_other_tasks(self):
+        ticks = []
+
+        async def ticker(search):
+            while not search.done():
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def main():
+            search = asyncio.ensure_future(self.path_G.adijkstra(0, yield_every=10))
+            await asyncio.gather(search, ticker(search))
+            return search.result()
+
+        distances, _ = self.run_until_complete(main())
+        self.assertEqual(distances[500], 500)
+        self.assertGreaterEqual(len(ticks), 50)
+
+
+    def test_deadline(self):
+        deadline = self.loop.time() - 1
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self.run_until_complete(self.path_G.abfs(500, start=0, yield_every=10, deadline=deadline))
+        with self.assertRaises(asyncio.TimeoutError):
+            self.run_until_complete(self.path_G.adijkstra(0, yield_every=10, deadline=deadline))
+
+        # Searches shorter than 'yield_every' never check the deadline
+        self.assertEqual(self.run_until_complete(self.path_G.abfs(2, start=0, deadline=deadline)), (True, [0, 1, 2]))
+
+
+    def test_cancellation(self):
+        async def main():
+            search = asyncio.ensure_future(self.path_G.abfs(500, start=0, yield_every=1))
+            for _ in range(5):
+                await asyncio.sleep(0)
+            search.cancel()
+            await search
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.run_until_complete(main())
+
+
+    def test_changes_during_a_search(self):
+        G = self.path_G
+
+        async def main(search):
+            search = asyncio.ensure_future(search)
+            await asyncio.sleep(0)
+            G.add_edges((500, 501, 1))
+            return await search
+
+        with self.assertRaises(RuntimeError):
+            self.run_until_complete(main(G.abfs(500, start=0, yield_every=10)))
+        with self.assertRaises(RuntimeError):
+            self.run_until_complete(main(G.adijkstra(0, yield_every=10)))
+
+        # Snapshots are never changed
+        self.assertEqual(self.run_until_complete(main(G.freeze().abfs(500, start=0, yield_every=10))), G.breadth_first_search(500, start=0))
+
+
+    def test_cache_and_stats(self):
+        G = self.weighted_G
+        G.enable_cache()
+
+        self.assertEqual(self.run_until_complete(G.abfs("B", start="D", yield_every=2)), (True, ["D", "C", "P", "B"]))
+        self.assertEqual(G.breadth_first_search("B", start="D"), (True, ["D", "C", "P", "B"]))
+        self.assertEqual(G.cache_info().hits, 1)
+
+        G.disable_cache()
+        G.enable_stats()
+        self.run_until_complete(G.adijkstra("D", yield_every=2))
+        dijkstra = G.get_stats().last
+        G.dijkstra("D")
+
+        self.assertEqual(dijkstra.operation, "adijkstra")
+        self.assertEqual(dijkstra.nodes_expanded, G.get_stats().last.nodes_expanded)
+        self.assertEqual(dijkstra.heap_pushes, G.get_stats().last.heap_pushes)
+
+
+    def test_executor(self):
+        G = self.weighted_G.freeze()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertEqual(self.run_until_complete(G.abfs("B", start="D", executor=executor)), (True, ["D", "C", "P", "B"]))
+            self.assertEqual(self.run_until_complete(G.adijkstra("D", executor=executor, deadline=self.loop.time() + 60)), G.dijkstra("D"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pickle
+import shutil
+import tempfile
+import unittest
+import src.graphex as gx
+
+
+class TestBinaryFormat(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'graph.gx')
+
+        self.weighted_G = gx.Graph(weighted=True)
+        self.weighted_G.add_edges([("A", "T", "118"), ("T", "L", "111"), ("M", "L", "70"), ("M", "D", "75"), ("D", "C", "120"), ("C", "R", "146"), ("C", "P", "138"),
+                          ("R", "S", "80"), ("A", "S", "140"), ("S", "F", "99"), ("R", "P", "97"), ("P", "B", "101"), ("B", "G", "90"), ("F", "B", "211")])
+
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+
+    def test_round_trip(self):
+        self.weighted_G.save(self.path)
+
+        for mmap in (True, False):
+            G = gx.Graph.load(self.path, mmap=mmap)
+
+            self.assertEqual(G.get_nodes(), self.weighted_G.get_nodes())
+            self.assertEqual(G.get_edges(), self.weighted_G.get_edges())
+            self.assertEqual(G.get_weight(("C", "P")), 138)
+            self.assertEqual(G.uniform_cost_search(start="D", goal="B"), (True, 359))
+            self.assertEqual(G.breadth_first_search(start="D", goal="B"), (True, ["D", "C", "P", "B"]))
+
+
+    def test_round_trip_of_directed_graph_with_float_weights(self):
+        G = gx.Graph(weighted=True, directed=True)
+        G.add_edges([(1, 2, 0.5), (2, 3, 0.25), (3, 1, 1)])
+        G.add_nodes((4, 4))
+        G.save(self.path)
+
+        loaded = gx.Graph.load(self.path)
+
+        self.assertEqual(loaded.get_nodes(), [1, 2, 3, (4, 4)])
+        self.assertEqual(loaded.get_weight((2, 3)), 0.25)
+        self.assertEqual(loaded.predecessors(1), [3])
+        self.assertEqual(loaded.dijkstra(1), G.dijkstra(1))
+
+
+    def test_mapped_graph_pickles_as_its_path(self):
+        gx.Graph.from_edges([(1, 2)], directed=True).save(self.path)
+        G = gx.Graph.load(self.path)
+
+        data = pickle.dumps(G)
+        self.assertLess(len(data), 200)
+        self.assertEqual(pickle.loads(data).get_edges(), G.get_edges())
+
+
+    def test_loading_other_files(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'1 2\n2 3\n' * 10)
+
+        with self.assertRaises(ValueError) as context:
+            gx.Graph.load(self.path)
+
+        self.assertTrue('is not a graph file' in str(context.exception))
+
+
+    def test_loading_truncated_files(self):
+        gx.Graph.from_edges([(i, i + 1, 1) for i in range(20)], weighted=True).save(self.path)
+        size = os.path.getsize(self.path)
+
+        for cut in (64, size - 40):
+            with open(self.path, 'r+b') as file:
+                file.truncate(size - cut)
+
+            for mmap in (True, False):
+                with self.assertRaises(ValueError) as context:
+                    gx.Graph.load(self.path, mmap=mmap)
+
+                self.assertTrue('is truncated' in str(context.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,217 @@
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+import time
+import unittest
+import src.graphex as gx
+from src.concurrency import ConcurrentGraph
+
+
+class TestConcurrentGraph(unittest.TestCase):
+
+    def setUp(self):
+        G = gx.Graph(weighted=True)
+        G.add_edges([("A", "T", "118"), ("T", "L", "111"), ("M", "L", "70"), ("M", "D", "75"), ("D", "C", "120"), ("C", "R", "146"), ("C", "P", "138"),
+                     ("R", "S", "80"), ("A", "S", "140"), ("S", "F", "99"), ("R", "P", "97"), ("P", "B", "101"), ("B", "G", "90"), ("F", "B", "211")])
+        # Without the timer, single writes are only published by flush()
+        self.G = ConcurrentGraph(G, max_delay=None)
+
+
+    def test_reads_and_writes(self):
+        self.assertEqual(self.G.uniform_cost_search(start="D", goal="B"), (True, 359))
+
+        self.G.update_weight(("C", "P"), 10)
+        # Single writes are only visible once published
+        self.assertEqual(self.G.uniform_cost_search(start="D", goal="B"), (True, 359))
+        self.G.flush()
+        self.assertEqual(self.G.uniform_cost_search(start="D", goal="B"), (True, 231))
+
+        self.G.remove_edges(("C", "P"))
+        self.G.add_edges(("D", "B", 1))
+        self.G.flush()
+        self.assertEqual(self.G.breadth_first_search(start="D", goal="B"), (True, ["D", "B"]))
+        self.assertEqual(self.G.version(), 2)
+
+        with self.assertRaises(AttributeError):
+            self.G.enable_cache()
+        with self.assertRaises(AttributeError):
+            self.G.missing
+
+
+    def test_snapshots_are_isolated(self):
+        before = self.G.snapshot()
+
+        with self.G.batch() as G:
+            G.remove_nodes("P")
+            # Readers still see the last published version
+            self.assertTrue(self.G.has_edge(("C", "P")))
+            G.add_edges(("C", "B", 5))
+
+        self.assertEqual(self.G.get_adjacency_list("C"), [("D", 120), ("R", 146), ("B", 5)])
+        self.assertEqual(before.get_adjacency_list("C"), [("D", 120), ("R", 146), ("P", 138)])
+        self.assertIsNot(self.G.snapshot(), before)
+
+
+    def test_failed_batch_is_rolled_back(self):
+        with self.assertRaises(KeyError):
+            with self.G.batch() as G:
+                G.remove_nodes("P")
+                G.remove_edges(("A", "B"))
+
+        self.assertEqual(self.G.version(), 0)
+        self.G.add_nodes("Z")
+        self.G.flush()
+        self.assertTrue(self.G.has_edge(("C", "P")))
+        self.assertEqual(self.G.get_nodes()[-1], "Z")
+        self.assertEqual(self.G.uniform_cost_search(start="D", goal="B"), (True, 359))
+
+
+    def test_single_writes_are_coalesced(self):
+        G = ConcurrentGraph(directed=True, max_pending=3, max_delay=None)
+        first = G.snapshot()
+
+        G.add_edges((1, 2))
+        G.add_edges((2, 3))
+        self.assertEqual(G.version(), 0)
+        G.add_edges_bulk(iter([(3, 4)]))
+        self.assertEqual(G.version(), 1)
+
+        G.remove_edges((1, 2))
+        G.flush()
+        G.flush()
+        self.assertEqual(G.version(), 2)
+        self.assertEqual(G.get_edges(), [(2, 3), (3, 4)])
+        self.assertEqual(first.get_edges(), [])
+
+        with self.assertRaises(ValueError):
+            ConcurrentGraph(max_pending=0)
+
+
+    def test_failed_write_keeps_pending_writes(self):
+        edges = [("D", "B", 1)]
+        self.G.add_edges(edges)
+        edges.append(("A", "B", 1))
+
+        with self.assertRaises(KeyError):
+            self.G.remove_edges([("C", "P"), ("A", "B")])
+        with self.assertRaises(KeyError):
+            with self.G.batch() as G:
+                G.remove_nodes("P")
+                G.remove_nodes("Z")
+
+        self.assertEqual(self.G.version(), 0)
+        self.G.flush()
+        self.assertTrue(self.G.has_edge(("C", "P")))
+        self.assertTrue(self.G.has_edge(("D", "B")))
+        self.assertFalse(self.G.has_edge(("A", "B")))
+        self.assertEqual(self.G.version(), 1)
+
+
+    def test_batch_proxy_expires(self):
+        with self.G.batch() as G:
+            G.add_edges(("D", "B", 1))
+
+        with self.assertRaises(RuntimeError):
+            G.add_edges(("A", "B", 1))
+        self.assertFalse(self.G.has_edge(("A", "B")))
+
+
+    def test_reads_never_wait_for_writers(self):
+        self.G.add_edges(("D", "B", 1))
+        locked, release = threading.Event(), threading.Event()
+        results = []
+
+        def write():
+            with self.G._lock:
+                locked.set()
+                release.wait()
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        locked.wait()
+
+        reader = threading.Thread(target=lambda: results.append(self.G.has_edge(("D", "B"))))
+        reader.start()
+        reader.join(5)
+        finished = not reader.is_alive()
+
+        release.set()
+        writer.join()
+        reader.join()
+
+        self.assertTrue(finished)
+        self.assertEqual(results, [False])
+
+
+    def test_timer_publishes_single_writes(self):
+        G = ConcurrentGraph(directed=True, max_delay=0.01)
+        G.add_edges((1, 2))
+
+        for _ in range(500):
+            if G.version():
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(G.version(), 1)
+        self.assertEqual(G.get_edges(), [(1, 2)])
+
+
+    def test_failed_publish_drops_the_write_at_fault(self):
+        G = ConcurrentGraph(weighted=True, max_pending=3, max_delay=None)
+        G.add_edges((1, 2, 1))
+        # Weights beyond the range of floats cannot be frozen
+        G.add_edges((2, 3, 2 ** 2000))
+
+        with self.assertRaises(OverflowError):
+            G.add_edges((3, 4, 1))
+
+        self.assertEqual(G.version(), 1)
+        self.assertEqual(G.get_edges(), [(1, 2), (2, 1), (3, 4), (4, 3)])
+
+        G.add_edges((2, 3, 2 ** 2000))
+        with self.assertRaises(OverflowError):
+            with G.batch() as H:
+                H.add_edges((1, 3, 1))
+
+        G.flush()
+        self.assertEqual(G.version(), 1)
+        self.assertFalse(G.has_edge((1, 3)))
+        self.assertFalse(G.has_edge((2, 3)))
+
+
+    def test_readers_see_whole_batches(self):
+        # Every batch extends a path by two edges, so a consistent snapshot
+        # always has an even number of them
+        G = ConcurrentGraph(directed=True)
+        errors = []
+
+        def write():
+            for i in range(0, 200, 2):
+                with G.batch() as H:
+                    H.add_edges((i, i + 1))
+                    H.add_edges((i + 1, i + 2))
+
+        def read():
+            while writer.is_alive():
+                snapshot = G.snapshot()
+                edges = snapshot.get_edges()
+                if len(edges) % 2 or (edges and not snapshot.breadth_first_search(len(edges), start=0, get_path=False)):
+                    errors.append(len(edges))
+
+        writer = threading.Thread(target=write)
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        writer.start()
+        for reader in readers:
+            reader.start()
+        writer.join()
+        for reader in readers:
+            reader.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(G.version(), 100)
+        self.assertEqual(len(G.get_edges()), 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
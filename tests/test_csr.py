@@ -0,0 +1,106 @@
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+import src.graphex as gx
+
+
+class TestFrozenGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.G = gx.Graph()
+        self.G.add_nodes(["A", "T", "L", "M", "D", "C", "S", "R", "F", "P", "B", "G"])
+        self.G.add_edges([("A", "T"), ("T", "L"), ("M", "L"), ("M", "D"), ("D", "C"), ("C", "R"), ("C", "P"),
+                          ("R", "S"), ("A", "S"), ("S", "F"), ("R", "P"), ("P", "B"), ("B", "G"), ("F", "B")])
+
+        self.weighted_G = gx.Graph(weighted=True)
+        self.weighted_G.add_edges([("A", "T", "118"), ("T", "L", "111"), ("M", "L", "70"), ("M", "D", "75"), ("D", "C", "120"), ("C", "R", "146"), ("C", "P", "138"),
+                          ("R", "S", "80"), ("A", "S", "140"), ("S", "F", "99"), ("R", "P", "97"), ("P", "B", "101"), ("B", "G", "90"), ("F", "B", "211")])
+
+
+    def test_frozen_graph_has_same_nodes_and_edges(self):
+        frozen = self.G.freeze()
+
+        self.assertEqual(frozen.get_nodes(), self.G.get_nodes())
+        self.assertEqual(frozen.get_edges(), self.G.get_edges())
+        self.assertEqual(frozen.get_adjacency_list("C"), self.G.get_adjacency_list("C"))
+
+
+    def test_frozen_graph_weights(self):
+        frozen = self.weighted_G.freeze()
+
+        self.assertEqual(frozen.get_weight(("C", "P")), 138)
+        self.assertEqual(frozen.get_weight(("P", "C")), 138)
+        self.assertEqual(self.G.freeze().get_weight(("A", "T")), 1)
+
+
+    def test_frozen_graph_float_weights(self):
+        G = gx.Graph(weighted=True)
+        G.add_edges([("a", "b", 2.73), ("b", "c", 1)])
+
+        self.assertEqual(G.freeze().get_weight(("a", "b")), 2.73)
+
+
+    def test_frozen_graph_huge_integer_weights(self):
+        G = gx.Graph(weighted=True)
+        G.add_edges([("a", "b", 2 ** 63), ("b", "c", 1)])
+        frozen = G.freeze()
+
+        self.assertEqual(frozen.get_weight(("a", "b")), float(2 ** 63))
+        self.assertEqual(frozen.uniform_cost_search(start="a", goal="c"), (True, float(2 ** 63) + 1))
+
+
+    def test_getting_weight_from_inexistent_edge(self):
+        frozen = self.G.freeze()
+
+        with self.assertRaises(KeyError) as context:
+            _ = frozen.get_weight(("A", "B"))
+
+        self.assertTrue("Edge ('A', 'B') is not in the graph" in str(context.exception))
+
+
+    def test_frozen_graph_searches(self):
+        frozen = self.G.freeze()
+
+        self.assertEqual(frozen.breadth_first_search(start="D", goal="B"), (True, ['D', 'C', 'P', 'B']))
+        self.assertEqual(frozen.depth_first_search(start="D", goal="B"), self.G.depth_first_search(start="D", goal="B"))
+        self.assertEqual(frozen.breadth_first_search(start="D", goal="H"), (False, []))
+        self.assertEqual(list(frozen.iter_bfs("D")), list(self.G.iter_bfs("D")))
+        self.assertEqual(list(frozen.iter_dfs("D", max_depth=2)), list(self.G.iter_dfs("D", max_depth=2)))
+
+
+    def test_frozen_graph_shortest_paths(self):
+        frozen = self.weighted_G.freeze()
+
+        self.assertEqual(frozen.uniform_cost_search(start="D", goal="B"), (True, 120+138+101))
+        self.assertEqual(frozen.dijkstra("D"), self.weighted_G.dijkstra("D"))
+
+
+    def test_frozen_graph_ignores_later_changes(self):
+        frozen = self.G.freeze()
+        self.G.remove_edges(("B", "G"))
+
+        self.assertTrue(frozen.has_edge(("B", "G")))
+        self.assertFalse(self.G.has_edge(("B", "G")))
+
+
+    def test_frozen_graph_predecessors(self):
+        G = gx.Graph(weighted=True, directed=True)
+        G.add_edges([(1, 3, 2), (2, 3, 5), (3, 1, 1)])
+        frozen = G.freeze()
+
+        self.assertEqual(frozen.predecessors(3), [1, 2])
+        self.assertEqual(frozen.in_degree(3), 2)
+        self.assertEqual(frozen.in_degree(2), 0)
+        self.assertEqual(self.G.freeze().predecessors("C"), self.G.predecessors("C"))
+
+
+    def test_frozen_graph_is_immutable(self):
+        frozen = self.G.freeze()
+
+        self.assertFalse(hasattr(frozen, 'add_edges'))
+        self.assertFalse(hasattr(frozen, 'remove_nodes'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import unittest
+import src.graphex as gx
+from src.dynamic import DynamicShortestPaths
+
+
+class TestDynamicShortestPaths(unittest.TestCase):
+
+    def setUp(self):
+        self.G = gx.Graph(weighted=True)
+        self.G.add_edges([("A", "T", "118"), ("T", "L", "111"), ("M", "L", "70"), ("M", "D", "75"), ("D", "C", "120"), ("C", "R", "146"), ("C", "P", "138"),
+                          ("R", "S", "80"), ("A", "S", "140"), ("S", "F", "99"), ("R", "P", "97"), ("P", "B", "101"), ("B", "G", "90"), ("F", "B", "211")])
+        self.tracker = DynamicShortestPaths(self.G, ["D"])
+
+
+    def assertMatchesDijkstra(self, tracker, graph):
+        for source in tracker.get_sources():
+            distances, _ = graph.dijkstra(source)
+            self.assertEqual(tracker.distances(source), distances)
+
+
+    def test_initial_distances(self):
+        self.assertEqual(self.tracker.distance("B"), 120+138+101)
+        self.assertEqual(self.tracker.path("B"), ["D", "C", "P", "B"])
+        self.assertMatchesDijkstra(self.tracker, self.G)
+
+
+    def test_new_edge_repairs_distances(self):
+        self.tracker.distance("B")
+        self.G.add_edges([("D", "P", 10), ("B", "Z", 1)])
+
+        self.assertEqual(self.tracker.distance("B"), 10+101)
+        self.assertEqual(self.tracker.distance("Z"), 10+101+1)
+        self.assertEqual(self.tracker.path("G"), ["D", "P", "B", "G"])
+        self.assertMatchesDijkstra(self.tracker, self.G)
+
+
+    def test_higher_weight_and_removals_recompute(self):
+        self.tracker.distance("B")
+        self.G.update_weight(("C", "P"), 1000)
+        self.assertEqual(self.tracker.distance("B"), 120+146+97+101)
+
+        self.G.remove_edges(("P", "B"))
+        self.assertEqual(self.tracker.path("B"), ["D", "C", "R", "S", "F", "B"])
+
+        self.G.remove_nodes("F")
+        self.assertEqual(self.tracker.distance("B"), float('inf'))
+        self.assertEqual(self.tracker.path("B"), [])
+        self.assertMatchesDijkstra(self.tracker, self.G)
+
+
+    def test_several_sources(self):
+        self.tracker.add_source("G")
+        self.G.update_weight(("B", "G"), 1)
+
+        self.assertEqual(self.tracker.distance("P", source="G"), 102)
+        self.assertMatchesDijkstra(self.tracker, self.G)
+
+        with self.assertRaises(ValueError):
+            self.tracker.distance("P")
+
+
+    def test_closed_tracker_stops_following_the_graph(self):
+        self.tracker.close()
+        self.G.add_edges(("D", "B", 1))
+
+        self.assertNotIn(self.tracker, self.G._listeners)
+
+
+    def test_random_changes_match_dijkstra(self):
+        rng = random.Random(0)
+        for directed in (False, True):
+            G = gx.Graph(weighted=True, directed=directed)
+            G.add_edges([(rng.randrange(30), rng.randrange(30), rng.randint(1, 20)) for _ in range(60)])
+            tracker = DynamicShortestPaths(G, G.get_nodes()[:3])
+
+            for _ in range(200):
+                action = rng.random()
+                edges = G.get_edges()
+
+                if action < 0.4:
+                    G.add_edges((rng.randrange(35), rng.randrange(35), rng.randint(1, 20)))
+                elif action < 0.7 and edges:
+                    G.update_weight(rng.choice(edges), rng.randint(1, 20))
+                elif action < 0.9 and edges:
+                    G.remove_edges(rng.choice(edges))
+                elif len(G.get_nodes()) > 5:
+                    candidates = [node for node in G.get_nodes() if node not in tracker.get_sources()]
+                    G.remove_nodes(rng.choice(candidates))
+
+                self.assertMatchesDijkstra(tracker, G)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gzip
+import shutil
+import tempfile
+import unittest
+import src.graphex as gx
+
+
+class TestEdgeList(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+        self.weighted_G = gx.Graph(weighted=True)
+        self.weighted_G.add_edges([("A", "T", "118"), ("T", "L", "111"), ("M", "L", "70"), ("M", "D", "75"), ("D", "C", "120"), ("C", "R", "146"), ("C", "P", "138"),
+                          ("R", "S", "80"), ("A", "S", "140"), ("S", "F", "99"), ("R", "P", "97"), ("P", "B", "101"), ("B", "G", "90"), ("F", "B", "211.5")])
+
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+
+    def write(self, name, text):
+        with open(self.path(name), 'w') as file:
+            file.write(text)
+
+
+    def test_reading_unweighted_edges(self):
+        self.write('edges.txt', '# a comment\n1 2\n2\t3  # trailing comment\n\n3 4 ignored\n')
+
+        G = gx.Graph.read_edgelist(self.path('edges.txt'), nodetype=int)
+
+        self.assertEqual(G.get_nodes(), [1, 2, 3, 4])
+        self.assertEqual(len(G.get_edges()), 6)
+
+
+    def test_reading_weighted_edges_with_delimiter(self):
+        self.write('edges.csv', 'a,b,2.5\nb,c,3\n')
+
+        G = gx.Graph.read_edgelist(self.path('edges.csv'), weighted=True, directed=True, delimiter=',')
+
+        self.assertEqual(G.get_edges(), [('a', 'b'), ('b', 'c')])
+        self.assertEqual(G.get_weight(('a', 'b')), 2.5)
+        self.assertEqual(G.get_weight(('b', 'c')), 3)
+
+
+    def test_reading_in_small_chunks(self):
+        self.write('edges.txt', ''.join('{} {}\n'.format(i, i + 1) for i in range(100)))
+
+        G = gx.Graph.read_edgelist(self.path('edges.txt'), directed=True, chunk_size=7)
+
+        self.assertEqual(len(G.get_edges()), 100)
+
+
+    def test_reading_malformed_line(self):
+        self.write('edges.txt', 'a b 1\nc d\n')
+
+        with self.assertRaises(ValueError) as context:
+            gx.Graph.read_edgelist(self.path('edges.txt'), weighted=True)
+
+        self.assertTrue('Line 2' in str(context.exception))
+
+
+    def test_round_trip(self):
+        self.weighted_G.write_edgelist(self.path('edges.txt'))
+        G = gx.Graph.read_edgelist(self.path('edges.txt'), weighted=True)
+
+        self.assertEqual(sorted(G.get_edges()), sorted(self.weighted_G.get_edges()))
+        self.assertEqual(G.get_weight(("F", "B")), 211.5)
+        self.assertEqual(G.uniform_cost_search(start="D", goal="B"), (True, 359))
+
+
+    def test_gzip_round_trip(self):
+        self.weighted_G.freeze().write_edgelist(self.path('edges.txt.gz'), delimiter='\t')
+
+        with gzip.open(self.path('edges.txt.gz'), 'rt') as file:
+            self.assertEqual(len(file.readlines()), 14)
+
+        # Compressed files are recognized by their content, whatever their name
+        os.rename(self.path('edges.txt.gz'), self.path('edges.bin'))
+        G = gx.Graph.read_edgelist(self.path('edges.bin'), weighted=True, delimiter='\t')
+
+        self.assertEqual(sorted(G.get_edges()), sorted(self.weighted_G.get_edges()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import unittest
 import src.graphex as gx
+import src.heuristics as heuristics
 
 
 class TestGraphex(unittest.TestCase):
@@ -230,6 +231,142 @@ class TestGraphex(unittest.TestCase):
         self.assertTrue('Edge (10, 20) is not in the graph' in str(context.exception))
 
 
+    def test_adding_edge_to_directed_graph_creates_both_nodes(self):
+        self.directed_G.add_edges((10, 20))
+        nodes = self.directed_G.get_nodes()
+
+        self.assertIn(10, nodes)
+        self.assertIn(20, nodes)
+        self.assertEqual(len(self.directed_G.get_adjacency_list(20)), 0)
+
+
+    def test_adding_existent_edge_does_not_skip_remaining_edges(self):
+        self.G.add_edges([(10, 20), (10, 20), (20, 30)])
+        edges = self.G.get_edges()
+
+        self.assertIn((20, 30), edges)
+        self.assertEqual(len(edges), 4)
+
+
+    def test_has_edge(self):
+        self.directed_G.add_edges((10, 20))
+
+        self.assertTrue(self.directed_G.has_edge((10, 20)))
+        self.assertFalse(self.directed_G.has_edge((20, 10)))
+        self.assertFalse(self.directed_G.has_edge((30, 10)))
+
+
+    def test_updating_weight_of_inexistent_edge(self):
+        self.weighted_G.add_nodes([10, 20])
+
+        with self.assertRaises(KeyError) as context:
+            self.weighted_G.update_weight((10, 20), 5)
+
+        self.assertTrue('Edge (10, 20) is not in the graph' in str(context.exception))
+
+
+    def test_removing_node_removes_its_edges_in_undirected_graph(self):
+        self.G.add_edges([(10, 20), (20, 30), (30, 10)])
+        self.G.remove_nodes(20)
+        edges = self.G.get_edges()
+
+        self.assertNotIn(20, self.G.get_nodes())
+        self.assertEqual(sorted(edges), [(10, 30), (30, 10)])
+
+
+    def test_removing_node_removes_incoming_edges_in_directed_graph(self):
+        self.directed_G.add_edges([(10, 20), (20, 30), (30, 10)])
+        self.directed_G.remove_nodes(10)
+        edges = self.directed_G.get_edges()
+
+        self.assertEqual(edges, [(20, 30)])
+
+
+    def test_bulk_adding_edges_from_generator(self):
+        self.G.add_edges_bulk((i, i + 1) for i in range(3))
+        edges = self.G.get_edges()
+
+        self.assertEqual(len(edges), 6)
+        self.assertIn((1, 0), edges)
+        self.assertEqual(self.G.get_nodes(), [0, 1, 2, 3])
+
+
+    def test_bulk_adding_existent_edge_overrides_previous_weight(self):
+        self.weighted_G.add_edges_bulk([('a', 'b', 3), ('a', 'b', 5)])
+
+        self.assertEqual(self.weighted_G.get_weight(('a', 'b')), 5)
+        self.assertEqual(self.weighted_G.get_weight(('b', 'a')), 5)
+
+
+    def test_bulk_adding_edges_with_wrong_form(self):
+        with self.assertRaises(TypeError) as context:
+            self.weighted_G.add_edges_bulk([('a', 'b', 3), ('a', 'c')])
+
+        self.assertTrue('Edges in a weighted graph must be in the form (u, v, w)' in str(context.exception))
+
+    def test_bulk_adding_edges_as_strings(self):
+        for edges in (["ab", "cd"], ("ab", "cd"), "ab", iter([b"ab"])):
+            with self.assertRaises(TypeError):
+                self.G.add_edges_bulk(edges)
+
+        self.assertEqual(self.G.get_nodes(), [])
+
+        self.G.add_edges_bulk([])
+        self.assertEqual(self.G.get_edges(), [])
+
+
+    def test_graph_from_edges_matches_add_edges(self):
+        edges = [(10, 20), (20, 30), (30, 10), (20, 40)]
+        self.directed_G.add_edges(edges)
+        bulk_G = gx.Graph.from_edges(iter(edges), directed=True)
+
+        self.assertEqual(bulk_G.get_nodes(), self.directed_G.get_nodes())
+        self.assertEqual(bulk_G.get_edges(), self.directed_G.get_edges())
+
+
+    def test_mixed_labels_are_kept(self):
+        self.G.add_edges([(10, 'a'), ('a', 3.14), (3.14, (1, 2))])
+
+        self.assertEqual(self.G.get_nodes(), [10, 'a', 3.14, (1, 2)])
+        self.assertIn(((1, 2), 3.14), self.G.get_edges())
+        self.assertEqual(self.G.get_adjacency_list('a'), [(10, 1), (3.14, 1)])
+
+
+    def test_adding_nodes_after_removing_nodes(self):
+        self.G.add_edges([(10, 20), (20, 30)])
+        self.G.remove_nodes(10)
+        self.G.add_edges([(40, 20)])
+
+        self.assertEqual(self.G.get_nodes(), [20, 30, 40])
+        self.assertEqual(sorted(self.G.get_edges()), [(20, 30), (20, 40), (30, 20), (40, 20)])
+        self.assertFalse(self.G.has_edge((10, 20)))
+        self.assertEqual(self.G.breadth_first_search(start=40, goal=30), (True, [40, 20, 30]))
+
+
+    def test_predecessors_and_in_degree_in_directed_graph(self):
+        self.directed_G.add_edges([(10, 30), (20, 30), (30, 40)])
+
+        self.assertEqual(self.directed_G.predecessors(30), [10, 20])
+        self.assertEqual(self.directed_G.in_degree(30), 2)
+        self.assertEqual(self.directed_G.in_degree(10), 0)
+
+
+    def test_predecessors_in_undirected_graph(self):
+        self.G.add_edges([(10, 30), (20, 30)])
+
+        self.assertEqual(self.G.predecessors(30), [10, 20])
+        self.assertEqual(self.G.in_degree(10), 1)
+
+
+    def test_predecessors_after_removing_edges_and_nodes(self):
+        self.directed_G.add_edges([(10, 30), (20, 30), (30, 10), (30, 30)])
+        self.directed_G.remove_edges((20, 30))
+        self.directed_G.remove_nodes(10)
+
+        self.assertEqual(self.directed_G.predecessors(30), [30])
+        self.assertEqual(self.directed_G.get_edges(), [(30, 30)])
+
+
     def test_turning_undirected_graph_into_directed(self):
         pass
 
@@ -272,7 +409,7 @@ class TestGraphex(unittest.TestCase):
         found, path  = self.G.breadth_first_search(start="D", goal="B")
 
         self.assertTrue(found)
-        self.assertTrue(path == ['D', 'M', 'C', 'L', 'R', 'P', 'T', 'S', 'B'])
+        self.assertTrue(path == ['D', 'C', 'P', 'B'])
 
     def test_BFS_with_no_path(self):
         self.G.add_nodes(["A", "T", "L", "M", "D", "C", "S", "R", "F", "P", "B", "G"])
@@ -300,7 +437,7 @@ class TestGraphex(unittest.TestCase):
         found, path  = self.G.breadth_first_search(goal="B")
 
         self.assertTrue(found)
-        self.assertTrue(path == ['D', 'M', 'C', 'L', 'R', 'P', 'T', 'S', 'B'])
+        self.assertTrue(path == ['D', 'C', 'P', 'B'])
 
     def test_BFS_no_result(self):
         self.G.add_nodes(["A", "T", "L", "M", "D", "C", "S", "R", "F", "P", "B", "G"])
@@ -321,6 +458,38 @@ class TestGraphex(unittest.TestCase):
         self.assertFalse(found)
         self.assertTrue(path == [])
 
+    def test_BFS_path_is_shortest_in_edges(self):
+        self.directed_G.add_edges([(1, 2), (2, 3), (3, 4), (1, 5), (5, 4), (4, 6)])
+
+        found, path = self.directed_G.breadth_first_search(start=1, goal=6)
+
+        self.assertTrue(found)
+        self.assertEqual(path, [1, 5, 4, 6])
+
+    def test_BFS_start_is_goal(self):
+        self.G.add_edges([("A", "B")])
+
+        found, path = self.G.breadth_first_search(start="A", goal="A")
+
+        self.assertTrue(found)
+        self.assertEqual(path, ["A"])
+
+    def test_BFS_with_multi_character_labels_and_no_start(self):
+        self.G.add_edges([("start", "middle"), ("middle", "end")])
+
+        found, path = self.G.breadth_first_search(goal="end")
+
+        self.assertTrue(found)
+        self.assertEqual(path, ["start", "middle", "end"])
+
+    def test_BFS_from_inexistent_node(self):
+        self.G.add_edges([("A", "B")])
+
+        with self.assertRaises(KeyError) as context:
+            _ = self.G.breadth_first_search(start="Z", goal="A")
+
+        self.assertTrue('Z is not a node of the graph' in str(context.exception))
+
     # DFS
 
     def test_DFS_with_no_nodes(self):
@@ -404,6 +573,53 @@ class TestGraphex(unittest.TestCase):
         self.assertFalse(found)
         self.assertTrue(path == [])
 
+    def test_DFS_path_follows_parents(self):
+        self.directed_G.add_edges([(1, 2), (1, 3), (2, 4), (3, 5), (5, 4)])
+
+        found, path = self.directed_G.depth_first_search(start=1, goal=4)
+
+        self.assertTrue(found)
+        self.assertEqual(path, [1, 3, 5, 4])
+
+    # Traversal iterators
+
+    def test_iter_bfs_yields_depth_and_parent(self):
+        self.G.add_edges([("A", "B"), ("A", "C"), ("B", "D"), ("C", "D"), ("D", "E")])
+
+        visited = list(self.G.iter_bfs("A"))
+
+        self.assertEqual(visited, [("A", 0, None), ("B", 1, "A"), ("C", 1, "A"), ("D", 2, "B"), ("E", 3, "D")])
+
+    def test_iter_bfs_with_max_depth(self):
+        self.G.add_edges([("A", "B"), ("A", "C"), ("B", "D"), ("C", "D"), ("D", "E")])
+
+        nodes = [node for node, _, _ in self.G.iter_bfs("A", max_depth=1)]
+
+        self.assertEqual(nodes, ["A", "B", "C"])
+
+    def test_iter_bfs_is_lazy(self):
+        self.directed_G.add_edges([(i, i + 1) for i in range(100)])
+        iterator = self.directed_G.iter_bfs(0)
+
+        self.assertEqual(next(iterator), (0, 0, None))
+        self.assertEqual(next(iterator), (1, 1, 0))
+
+    def test_iter_dfs_matches_DFS_order(self):
+        self.G.add_nodes(["A", "T", "L", "M", "D", "C", "S", "R", "F", "P", "B", "G"])
+        self.G.add_edges([("A", "T"), ("T", "L"), ("M", "L"), ("M", "D"), ("D", "C"), ("C", "R"), ("C", "P"),
+                          ("R", "S"), ("A", "S"), ("S", "F"), ("R", "P"), ("P", "B"), ("B", "G"), ("F", "B")])
+
+        nodes = [node for node, _, _ in self.G.iter_dfs("D")]
+
+        self.assertEqual(nodes[:4], ['D', 'C', 'P', 'B'])
+        self.assertEqual(len(nodes), 12)
+
+    def test_iter_from_inexistent_node(self):
+        with self.assertRaises(KeyError) as context:
+            _ = self.G.iter_dfs("A")
+
+        self.assertTrue('A is not a node of the graph' in str(context.exception))
+
      # UCS
 
     def test_UCS_with_no_nodes(self):
@@ -447,6 +663,303 @@ class TestGraphex(unittest.TestCase):
         found = self.weighted_G.uniform_cost_search(goal="B")
         self.assertEqual(found[1], (120+138+101))
 
+    def test_UCS_keeps_float_weights(self):
+        self.weighted_G.add_edges([("A", "B", 0.5), ("B", "C", 0.25), ("A", "C", 1)])
+
+        found = self.weighted_G.uniform_cost_search(start="A", goal="C")
+        self.assertEqual(found, (True, 0.75))
+
+    def test_UCS_no_result(self):
+        self.weighted_G.add_edges([("A", "B", 1)])
+        self.weighted_G.add_nodes("C")
+
+        found = self.weighted_G.uniform_cost_search(start="A", goal="C")
+        self.assertEqual(found, (False, []))
+
+    # Dijkstra
+
+    def test_dijkstra_distances_and_path(self):
+        self.weighted_G.add_edges([("A", "T", "118"), ("T", "L", "111"), ("M", "L", "70"), ("M", "D", "75"), ("D", "C", "120"), ("C", "R", "146"), ("C", "P", "138"),
+                          ("R", "S", "80"), ("A", "S", "140"), ("S", "F", "99"), ("R", "P", "97"), ("P", "B", "101"), ("B", "G", "90"), ("F", "B", "211")])
+
+        distances, predecessors = self.weighted_G.dijkstra("D")
+
+        self.assertEqual(len(distances), 12)
+        self.assertEqual(distances["B"], 120+138+101)
+        self.assertEqual(gx.Graph.build_path(predecessors, "B"), ["D", "C", "P", "B"])
+
+    def test_dijkstra_stops_at_goal(self):
+        self.directed_G.add_edges([(1, 2), (2, 3), (3, 4)])
+
+        distances, predecessors = self.directed_G.dijkstra(1, goal=2)
+
+        self.assertEqual(distances, {1: 0, 2: 1})
+        self.assertEqual(gx.Graph.build_path(predecessors, 4), [])
+
+    def test_dijkstra_from_inexistent_node(self):
+        with self.assertRaises(KeyError) as context:
+            _ = self.G.dijkstra("A")
+
+        self.assertTrue('A is not a node of the graph' in str(context.exception))
+
+    def test_shortest_paths_many(self):
+        self.weighted_G.add_edges([("A", "T", "118"), ("T", "L", "111"), ("M", "L", "70"), ("M", "D", "75"), ("D", "C", "120"), ("C", "R", "146"), ("C", "P", "138"),
+                          ("R", "S", "80"), ("A", "S", "140"), ("S", "F", "99"), ("R", "P", "97"), ("P", "B", "101"), ("B", "G", "90"), ("F", "B", "211")])
+        self.weighted_G.add_nodes("Z")
+
+        matrix = self.weighted_G.shortest_paths_many(["D", "A", "Z"], ["B", "D", "Z"])
+
+        self.assertEqual(matrix[0], [120+138+101, 0, float('inf')])
+        self.assertEqual(matrix[1], [140+80+97+101, 75+70+111+118, float('inf')])
+        self.assertEqual(matrix[2], [float('inf'), float('inf'), 0])
+
+    def test_shortest_paths_many_to_all_nodes(self):
+        self.weighted_G.add_edges([(1, 2, 1), (2, 3, 2.5)])
+
+        self.assertEqual(self.weighted_G.shortest_paths_many([1, 3]), [[0, 1, 3.5], [3.5, 2.5, 0]])
+
+    def test_nearest_source(self):
+        self.weighted_G.add_edges([(1, 2, 1), (2, 3, 5), (3, 4, 1), (4, 5, 1)])
+
+        nearest = self.weighted_G.nearest_source([1, 5])
+
+        self.assertEqual(nearest[2], (1, 1))
+        self.assertEqual(nearest[3], (5, 2))
+        self.assertEqual(nearest[5], (5, 0))
+        self.assertEqual(self.weighted_G.nearest_source([1, 5], targets=[2]), {2: (1, 1)})
+
+    def test_numeric_string_weights_are_converted(self):
+        self.weighted_G.add_edges([("A", "B", "2.5"), ("B", "C", "3")])
+
+        self.assertEqual(self.weighted_G.get_weight(("A", "B")), 2.5)
+        self.assertEqual(self.weighted_G.get_weight(("B", "C")), 3)
+
+    def test_non_numeric_weights_are_rejected(self):
+        with self.assertRaises(TypeError) as context:
+            self.weighted_G.add_edges(("A", "B", "heavy"))
+
+        self.assertTrue('Edge weights must be numbers' in str(context.exception))
+
+    # Bidirectional searches
+
+    def test_bidirectional_search_matches_BFS(self):
+        self.G.add_edges([("A", "T"), ("T", "L"), ("M", "L"), ("M", "D"), ("D", "C"), ("C", "R"), ("C", "P"),
+                          ("R", "S"), ("A", "S"), ("S", "F"), ("R", "P"), ("P", "B"), ("B", "G"), ("F", "B")])
+        nodes = self.G.get_nodes()
+
+        for start in nodes:
+            for goal in nodes:
+                found, path = self.G.bidirectional_search(start=start, goal=goal)
+                expected = self.G.breadth_first_search(start=start, goal=goal)[1]
+
+                self.assertTrue(found)
+                self.assertEqual(len(path), len(expected))
+                self.assertEqual((path[0], path[-1]), (start, goal))
+                self.assertTrue(all(self.G.has_edge(edge) for edge in zip(path, path[1:])))
+
+    def test_bidirectional_search_in_directed_graph(self):
+        self.directed_G.add_edges([(1, 2), (2, 3), (3, 4), (4, 1), (1, 5), (5, 4)])
+
+        self.assertEqual(self.directed_G.bidirectional_search(start=1, goal=4), (True, [1, 5, 4]))
+        self.assertEqual(self.directed_G.bidirectional_search(start=4, goal=5), (True, [4, 1, 5]))
+        self.assertFalse(self.directed_G.bidirectional_search(start=1, goal=6, get_path=False))
+
+    def test_bidirectional_dijkstra_matches_UCS(self):
+        self.weighted_G.add_edges([("A", "T", "118"), ("T", "L", "111"), ("M", "L", "70"), ("M", "D", "75"), ("D", "C", "120"), ("C", "R", "146"), ("C", "P", "138"),
+                          ("R", "S", "80"), ("A", "S", "140"), ("S", "F", "99"), ("R", "P", "97"), ("P", "B", "101"), ("B", "G", "90"), ("F", "B", "211")])
+        nodes = self.weighted_G.get_nodes()
+
+        for start in nodes:
+            for goal in nodes:
+                self.assertEqual(self.weighted_G.bidirectional_dijkstra(start=start, goal=goal),
+                                 self.weighted_G.uniform_cost_search(start=start, goal=goal))
+
+        self.assertEqual(self.weighted_G.bidirectional_dijkstra(start="D", goal="B", get_path=True),
+                         (True, 120+138+101, ["D", "C", "P", "B"]))
+
+    def test_bidirectional_dijkstra_in_directed_graph(self):
+        weighted_directed_G = gx.Graph(weighted=True, directed=True)
+        weighted_directed_G.add_edges([(1, 2, 1), (2, 3, 1), (1, 3, 5), (3, 1, 1)])
+        weighted_directed_G.add_nodes(4)
+
+        self.assertEqual(weighted_directed_G.bidirectional_dijkstra(start=1, goal=3, get_path=True), (True, 2, [1, 2, 3]))
+        self.assertEqual(weighted_directed_G.bidirectional_dijkstra(start=3, goal=2), (True, 2))
+        self.assertEqual(weighted_directed_G.bidirectional_dijkstra(start=1, goal=4), (False, []))
+
+    # A*
+
+    def test_a_star_on_grid_with_manhattan_heuristic(self):
+        grid_G = gx.Graph(weighted=True)
+        for x in range(5):
+            for y in range(5):
+                if x < 4:
+                    grid_G.add_edges(((x, y), (x + 1, y), 1))
+                if y < 4:
+                    grid_G.add_edges(((x, y), (x, y + 1), 1))
+
+        found, cost, path = grid_G.a_star((0, 0), (4, 3), heuristics.manhattan(), get_path=True)
+
+        self.assertTrue(found)
+        self.assertEqual(cost, 7)
+        self.assertEqual(len(path), 8)
+        self.assertEqual((path[0], path[-1]), ((0, 0), (4, 3)))
+
+    def test_a_star_with_euclidean_heuristic_and_positions(self):
+        positions = {"A": (0, 0), "B": (3, 0), "C": (3, 4), "D": (0, 4)}
+        self.weighted_G.add_edges([("A", "B", 3), ("B", "C", 4), ("A", "C", 10), ("A", "D", 4), ("D", "C", 3)])
+
+        found = self.weighted_G.a_star("A", "C", heuristics.euclidean(positions))
+
+        self.assertEqual(found, (True, 7))
+
+    def test_a_star_takes_the_start_first(self):
+        G = gx.Graph(weighted=True, directed=True)
+        G.add_edges([(1, 2, 1), (2, 3, 1)])
+
+        self.assertEqual(G.a_star(1, 3, get_path=True), (True, 2, [1, 2, 3]))
+        self.assertEqual(G.a_star(3, 1), (False, []))
+
+    def test_a_star_without_heuristic_matches_UCS(self):
+        self.weighted_G.add_edges([("A", "T", "118"), ("T", "L", "111"), ("M", "L", "70"), ("M", "D", "75"), ("D", "C", "120"), ("C", "R", "146"), ("C", "P", "138"),
+                          ("R", "S", "80"), ("A", "S", "140"), ("S", "F", "99"), ("R", "P", "97"), ("P", "B", "101"), ("B", "G", "90"), ("F", "B", "211")])
+        self.weighted_G.add_nodes("Z")
+
+        for goal in self.weighted_G.get_nodes():
+            self.assertEqual(self.weighted_G.a_star("D", goal), self.weighted_G.uniform_cost_search(start="D", goal=goal))
+
+    # Query cache
+
+    def test_cache_is_disabled_by_default(self):
+        self.G.add_edges([("A", "B")])
+        self.G.breadth_first_search(start="A", goal="B")
+
+        self.assertIsNone(self.G.cache_info())
+
+    def test_cache_hits_and_misses(self):
+        self.G.add_edges([("A", "B"), ("B", "C")])
+        self.G.enable_cache(maxsize=4)
+
+        first = self.G.breadth_first_search(start="A", goal="C")
+        second = self.G.breadth_first_search(start="A", goal="C")
+        self.G.breadth_first_search(start="A", goal="C", get_path=False)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.G.cache_info(), (1, 2, 0, 2, 4))
+
+    def test_cache_is_invalidated_by_changes(self):
+        self.weighted_G.add_edges([("A", "B", 1), ("B", "C", 1), ("A", "C", 5)])
+        self.weighted_G.enable_cache()
+
+        self.assertEqual(self.weighted_G.uniform_cost_search(start="A", goal="C"), (True, 2))
+        self.weighted_G.update_weight(("B", "C"), 10)
+        self.assertEqual(self.weighted_G.uniform_cost_search(start="A", goal="C"), (True, 5))
+        self.weighted_G.remove_edges(("A", "C"))
+        self.assertEqual(self.weighted_G.uniform_cost_search(start="A", goal="C"), (True, 11))
+        self.weighted_G.remove_nodes("B")
+        self.weighted_G.add_edges(("C", "D", 1))
+        self.assertEqual(self.weighted_G.uniform_cost_search(start="A", goal="C"), (False, []))
+
+        self.assertEqual(self.weighted_G.cache_info().hits, 0)
+
+    def test_cache_evicts_least_recently_used(self):
+        self.G.add_edges([("A", "B"), ("B", "C")])
+        self.G.enable_cache(maxsize=2)
+
+        self.G.depth_first_search(start="A", goal="B")
+        self.G.depth_first_search(start="A", goal="C")
+        self.G.depth_first_search(start="A", goal="B")
+        self.G.depth_first_search(start="C", goal="A")
+        self.G.depth_first_search(start="A", goal="B")
+
+        info = self.G.cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions, info.size), (2, 3, 1, 2))
+
+    def test_cached_paths_are_copies(self):
+        self.G.add_edges([("A", "B")])
+        self.G.enable_cache()
+
+        _, path = self.G.breadth_first_search(start="A", goal="B")
+        path.append("Z")
+
+        self.assertEqual(self.G.breadth_first_search(start="A", goal="B"), (True, ["A", "B"]))
+
+    # Connectivity
+
+    def test_connected_components(self):
+        self.G.add_edges([(1, 2), (2, 3), (4, 5)])
+        self.G.add_nodes(6)
+
+        self.assertEqual(self.G.connected_components(), [[1, 2, 3], [4, 5], [6]])
+
+    def test_connected_components_of_directed_graph_are_weak(self):
+        self.directed_G.add_edges([(1, 2), (3, 2), (4, 5)])
+
+        self.assertEqual(self.directed_G.connected_components(), [[1, 2, 3], [4, 5]])
+
+    def test_is_connected_follows_changes(self):
+        self.G.add_edges([(1, 2), (3, 4)])
+
+        self.assertFalse(self.G.is_connected(1, 4))
+        self.G.add_edges((2, 3))
+        self.assertTrue(self.G.is_connected(1, 4))
+        self.G.add_nodes(5)
+        self.assertFalse(self.G.is_connected(5, 1))
+        self.G.remove_edges((2, 3))
+        self.assertFalse(self.G.is_connected(1, 4))
+        self.G.add_edges_bulk([(5, 4), (4, 1)])
+        self.assertTrue(self.G.is_connected(5, 2))
+        self.G.remove_nodes(4)
+        self.assertFalse(self.G.is_connected(5, 2))
+
+    def test_strongly_connected_components(self):
+        self.directed_G.add_edges([(1, 2), (2, 3), (3, 1), (3, 4), (4, 5), (5, 4), (6, 5)])
+
+        components = self.directed_G.strongly_connected_components()
+
+        self.assertEqual(sorted(sorted(component) for component in components), [[1, 2, 3], [4, 5], [6]])
+        self.assertEqual(sorted(components[0]), [4, 5])
+
+    def test_strongly_connected_components_do_not_recurse(self):
+        self.directed_G.add_edges_bulk((i, i + 1) for i in range(5000))
+        self.directed_G.add_edges((5000, 0))
+
+        components = self.directed_G.strongly_connected_components()
+
+        self.assertEqual(len(components), 1)
+        self.assertEqual(len(components[0]), 5001)
+
+    # Minimum spanning tree
+
+    def test_minimum_spanning_tree(self):
+        self.weighted_G.add_edges([("A", "T", "118"), ("T", "L", "111"), ("M", "L", "70"), ("M", "D", "75"), ("D", "C", "120"), ("C", "R", "146"), ("C", "P", "138"),
+                          ("R", "S", "80"), ("A", "S", "140"), ("S", "F", "99"), ("R", "P", "97"), ("P", "B", "101"), ("B", "G", "90"), ("F", "B", "211")])
+
+        for method in ('kruskal', 'prim'):
+            tree = self.weighted_G.minimum_spanning_tree(method=method)
+
+            self.assertEqual(len(tree), 11)
+            self.assertEqual(sum(w for _, _, w in tree), 1099)
+            self.assertEqual(len(gx.Graph.from_edges(tree, weighted=True).connected_components()), 1)
+
+    def test_minimum_spanning_forest(self):
+        self.weighted_G.add_edges([(1, 2, 3), (2, 3, 1), (1, 3, 1), (4, 5, 2), (5, 5, 0)])
+        self.weighted_G.add_nodes(6)
+
+        for method in ('kruskal', 'prim'):
+            tree = self.weighted_G.minimum_spanning_tree(method=method)
+            self.assertEqual(sorted(w for _, _, w in tree), [1, 1, 2])
+
+    def test_minimum_spanning_tree_errors(self):
+        self.directed_G.add_edges((1, 2))
+        self.G.add_edges((1, 2))
+
+        with self.assertRaises(TypeError) as context:
+            self.directed_G.minimum_spanning_tree()
+        self.assertTrue('only defined for undirected graphs' in str(context.exception))
+
+        with self.assertRaises(ValueError):
+            self.G.minimum_spanning_tree(method='boruvka')
+
     # INTEGRATIONS TESTS
     
     def test_path_with_and_without_edge(self):
@@ -0,0 +1,179 @@
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+import src.graphex as gx
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import scipy.sparse as sparse
+except ImportError:
+    sparse = None
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestNumpyMatrices(unittest.TestCase):
+
+    def setUp(self):
+        self.weighted_G = gx.Graph(weighted=True)
+        self.weighted_G.add_edges([("A", "T", "118"), ("T", "L", "111"), ("M", "L", "70"), ("M", "D", "75"), ("D", "C", "120"), ("C", "R", "146"), ("C", "P", "138"),
+                          ("R", "S", "80"), ("A", "S", "140"), ("S", "F", "99"), ("R", "P", "97"), ("P", "B", "101"), ("B", "G", "90"), ("F", "B", "211")])
+
+        self.directed_G = gx.Graph(directed=True)
+        self.directed_G.add_edges([(1, 2), (2, 3), (3, 1), (3, 4)])
+
+
+    def test_numpy_matrix(self):
+        nodes = self.weighted_G.get_nodes()
+        M = self.weighted_G.to_numpy_matrix()
+
+        self.assertEqual(M.shape, (len(nodes), len(nodes)))
+        self.assertTrue((M == M.T).all())
+        self.assertEqual(M[nodes.index("C"), nodes.index("P")], 138)
+        self.assertEqual(M[nodes.index("A"), nodes.index("B")], 0)
+        self.assertEqual(M.sum(), 2 * 1596)
+
+
+    def test_numpy_matrix_of_directed_graph(self):
+        M = self.directed_G.to_numpy_matrix(nonedge=-1, dtype=int)
+
+        self.assertEqual(M.tolist(), [[-1, 1, -1, -1], [-1, -1, 1, -1], [1, -1, -1, 1], [-1, -1, -1, -1]])
+        self.assertEqual(self.directed_G.freeze().to_numpy_matrix().tolist(), (M == 1).astype(float).tolist())
+
+
+    def test_degree_vector(self):
+        self.assertEqual(self.directed_G.degree_vector().tolist(), [1, 1, 2, 0])
+        self.assertEqual(self.directed_G.degree_vector('in').tolist(), [1, 1, 1, 1])
+
+        nodes = self.weighted_G.get_nodes()
+        strengths = self.weighted_G.degree_vector(weighted=True)
+        self.assertEqual(strengths[nodes.index("B")], 101 + 90 + 211)
+
+        with self.assertRaises(ValueError):
+            self.directed_G.degree_vector('both')
+
+
+    def test_pagerank(self):
+        ranks = self.directed_G.pagerank()
+
+        self.assertAlmostEqual(sum(ranks.values()), 1)
+        self.assertEqual(max(ranks, key=ranks.get), 3)
+        self.assertLess(ranks[1], ranks[2])
+
+        # A cycle spreads its rank evenly
+        G = gx.Graph(directed=True)
+        G.add_edges([("a", "b"), ("b", "c"), ("c", "a")])
+        for rank in G.pagerank().values():
+            self.assertAlmostEqual(rank, 1 / 3)
+
+        self.assertEqual(gx.Graph().pagerank(), {})
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestAllPairsShortestPaths(unittest.TestCase):
+
+    def setUp(self):
+        self.weighted_G = gx.Graph(weighted=True)
+        self.weighted_G.add_edges([("A", "T", "118"), ("T", "L", "111"), ("M", "L", "70"), ("M", "D", "75"), ("D", "C", "120"), ("C", "R", "146"), ("C", "P", "138"),
+                          ("R", "S", "80"), ("A", "S", "140"), ("S", "F", "99"), ("R", "P", "97"), ("P", "B", "101"), ("B", "G", "90"), ("F", "B", "211")])
+        self.weighted_G.add_nodes("Z")
+
+        self.directed_G = gx.Graph(weighted=True, directed=True)
+        self.directed_G.add_edges([(0, 1, 4), (0, 2, 1), (2, 1, 2), (1, 3, 1), (3, 0, 3)])
+
+
+    def walk(self, hops, i, j):
+        path = [i]
+        while i != j:
+            i = int(hops[i, j])
+            path.append(i)
+        return path
+
+
+    def test_methods_agree_with_dijkstra(self):
+        nodes = self.weighted_G.get_nodes()
+
+        for method in ('floyd_warshall', 'dijkstra', 'auto'):
+            D = self.weighted_G.all_pairs_shortest_paths(method)
+
+            for i, u in enumerate(nodes):
+                distances, _ = self.weighted_G.dijkstra(u)
+                self.assertEqual(D[i].tolist(), [distances.get(v, float('inf')) for v in nodes])
+
+
+    def test_next_hops(self):
+        nodes = self.weighted_G.get_nodes()
+        D_index, B_index, Z_index = nodes.index("D"), nodes.index("B"), nodes.index("Z")
+
+        for method in ('floyd_warshall', 'dijkstra'):
+            D, hops = self.weighted_G.all_pairs_shortest_paths(method, next_hops=True)
+
+            self.assertEqual(D[D_index, B_index], 359)
+            self.assertEqual([nodes[i] for i in self.walk(hops, D_index, B_index)], ["D", "C", "P", "B"])
+            self.assertEqual(hops[D_index, Z_index], -1)
+            self.assertEqual(hops[Z_index, Z_index], Z_index)
+
+
+    def test_directed_graph_with_negative_weights(self):
+        expected = [[0, 3, 1, 4], [4, 0, 5, 1], [6, 2, 0, 3], [3, 6, 4, 0]]
+        D, hops = self.directed_G.all_pairs_shortest_paths(next_hops=True)
+        self.assertEqual(D.tolist(), expected)
+        self.assertEqual(self.walk(hops, 0, 3), [0, 2, 1, 3])
+
+        # Only Floyd-Warshall is correct here, so 'auto' must pick it
+        self.directed_G.update_weight((2, 1), -1)
+        D = self.directed_G.freeze().all_pairs_shortest_paths()
+        self.assertEqual(D[0].tolist(), [0, 0, 1, 1])
+
+
+    def test_invalid_method(self):
+        with self.assertRaises(ValueError):
+            self.directed_G.all_pairs_shortest_paths('bellman_ford')
+
+
+@unittest.skipIf(sparse is None, 'scipy is not installed')
+class TestScipySparse(unittest.TestCase):
+
+    def setUp(self):
+        self.G = gx.Graph(weighted=True, directed=True)
+        self.G.add_edges([("a", "b", 2), ("b", "c", 0.5), ("c", "a", 4), ("a", "d", 1)])
+
+
+    def test_to_scipy_sparse(self):
+        M = self.G.to_scipy_sparse()
+
+        self.assertEqual(M.format, 'csr')
+        self.assertEqual(M.nnz, 4)
+        self.assertEqual(M.toarray().tolist(), self.G.to_numpy_matrix().tolist())
+        self.assertEqual(self.G.to_scipy_sparse('coo').format, 'coo')
+
+
+    def test_round_trip(self):
+        nodes = self.G.get_nodes()
+        G = gx.Graph.from_scipy_sparse(self.G.to_scipy_sparse(), nodes=nodes)
+
+        self.assertEqual(G.get_nodes(), nodes)
+        self.assertEqual(sorted(G.get_edges()), sorted(self.G.get_edges()))
+        self.assertEqual(G.get_weight(("b", "c")), 0.5)
+
+
+    def test_from_scipy_sparse(self):
+        matrix = sparse.coo_matrix(([1, 1, 1], ([0, 1, 2], [1, 2, 0])), shape=(4, 4))
+        G = gx.Graph.from_scipy_sparse(matrix, weighted=False, directed=False)
+
+        self.assertEqual(G.get_nodes(), [0, 1, 2, 3])
+        self.assertEqual(G.get_adjacency_list(0), [(1, 1), (2, 1)])
+        self.assertEqual(G.get_adjacency_list(3), [])
+
+        with self.assertRaises(ValueError):
+            gx.Graph.from_scipy_sparse(sparse.csr_matrix((2, 3)))
+        with self.assertRaises(ValueError):
+            gx.Graph.from_scipy_sparse(matrix, nodes=["a"])
+
+
+if __name__ == '__main__':
+    unittest.main()
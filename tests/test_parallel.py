@@ -0,0 +1,65 @@
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+import src.graphex as gx
+from src.parallel import ParallelExecutor
+
+
+def out_degree(graph, node):
+    return len(graph.get_adjacency_list(node))
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'ProcessPoolExecutor initializers require Python 3.7')
+class TestParallelExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.G = gx.Graph(weighted=True)
+        self.G.add_edges([("A", "T", "118"), ("T", "L", "111"), ("M", "L", "70"), ("M", "D", "75"), ("D", "C", "120"), ("C", "R", "146"), ("C", "P", "138"),
+                          ("R", "S", "80"), ("A", "S", "140"), ("S", "F", "99"), ("R", "P", "97"), ("P", "B", "101"), ("B", "G", "90"), ("F", "B", "211")])
+        self.G.add_nodes("Z")
+
+
+    def test_bfs_from_all_sources(self):
+        with ParallelExecutor(self.G, workers=2) as executor:
+            depths = executor.bfs_all()
+
+        self.assertEqual(len(depths), 13)
+        self.assertEqual(depths["D"]["B"], 3)
+        self.assertEqual(depths["Z"], {"Z": 0})
+        self.assertEqual(depths["A"], {node: depth for node, depth, _ in self.G.iter_bfs("A")})
+
+
+    def test_uniform_cost_search_many(self):
+        pairs = [("B", "D"), ("G", "D"), ("B", "A"), ("Z", "A")]
+
+        with ParallelExecutor(self.G, workers=2, chunk_size=1) as executor:
+            results = executor.uniform_cost_search_many(pairs)
+
+        self.assertEqual(results, [self.G.uniform_cost_search(goal, start) for goal, start in pairs])
+        self.assertEqual(results[3], (False, []))
+
+
+    def test_uniform_cost_search_many_edge_cases(self):
+        # Missing goals are not reached, and a missing start is the first node
+        pairs = [("Y", "D"), ("B", None), ("A", None), (None, "A"), ("B", "D")]
+
+        with ParallelExecutor(self.G, workers=2, chunk_size=1) as executor:
+            results = executor.uniform_cost_search_many(pairs)
+
+            with self.assertRaises(KeyError):
+                executor.uniform_cost_search_many([("B", "Y")])
+
+        self.assertEqual(results, [self.G.uniform_cost_search(goal, start) for goal, start in pairs])
+        self.assertEqual(results[:4], [(False, []), (True, 418), (True, 0), (False, [])])
+
+
+    def test_map_nodes(self):
+        with ParallelExecutor(self.G.freeze(), workers=2) as executor:
+            degrees = executor.map_nodes(out_degree)
+
+        self.assertEqual(degrees, {node: out_degree(self.G, node) for node in self.G.get_nodes()})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+import src.graphex as gx
+
+
+class TestStats(unittest.TestCase):
+
+    def setUp(self):
+        self.star_G = gx.Graph()
+        self.star_G.add_edges([(0, 1), (0, 2), (0, 3)])
+
+        self.weighted_G = gx.Graph(weighted=True)
+        self.weighted_G.add_edges([("a", "b", 1), ("b", "c", 2), ("a", "c", 5)])
+
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.star_G.get_stats())
+        self.assertEqual(self.star_G.__dict__.keys() & {'breadth_first_search', '_successors', '_heappush'}, set())
+
+
+    def test_search_counters(self):
+        self.star_G.enable_stats()
+        self.assertEqual(self.star_G.breadth_first_search(-1, start=0), (False, []))
+
+        call = self.star_G.get_stats().last
+        self.assertEqual(call.operation, 'breadth_first_search')
+        self.assertEqual((call.nodes_expanded, call.edges_relaxed, call.peak_frontier, call.heap_pushes), (4, 6, 3, 0))
+        self.assertGreater(call.seconds, 0)
+
+        # Leaves 3 and 2 are popped and expanded before the goal
+        self.star_G.depth_first_search(1, start=0)
+        call = self.star_G.get_stats().last
+        self.assertEqual((call.nodes_expanded, call.edges_relaxed, call.peak_frontier), (3, 5, 3))
+
+
+    def test_heap_pushes_and_nested_searches(self):
+        self.weighted_G.enable_stats()
+        self.assertEqual(self.weighted_G.uniform_cost_search("c", start="a"), (True, 3))
+
+        call = self.weighted_G.get_stats().last
+        self.assertEqual((call.nodes_expanded, call.edges_relaxed, call.heap_pushes), (2, 4, 3))
+
+        # The Dijkstra run inside the search is not recorded on its own
+        self.assertEqual(list(self.weighted_G.get_stats().totals()), ['uniform_cost_search'])
+
+
+    def test_mutation_counters(self):
+        self.weighted_G.enable_stats()
+        self.weighted_G.add_edges([("c", "d", 1), ("d", "e", 1)])
+        self.weighted_G.add_edges_bulk((u, u + 1, 1) for u in range(3))
+        self.weighted_G.remove_nodes(["d", "e"])
+
+        totals = self.weighted_G.get_stats().totals()
+        self.assertEqual((totals['add_edges']['edges_changed'], totals['add_edges']['nodes_changed']), (2, 2))
+        self.assertEqual((totals['add_edges_bulk']['edges_changed'], totals['add_edges_bulk']['nodes_changed']), (3, 4))
+        self.assertEqual(totals['remove_nodes']['nodes_changed'], 2)
+        self.assertFalse(self.weighted_G.has_edge(("c", "d")))
+        self.assertTrue(self.weighted_G.has_edge((2, 3)))
+
+
+    def test_callback_and_totals(self):
+        calls = []
+        G = self.star_G.freeze()
+        G.enable_stats(callback=calls.append)
+
+        G.breadth_first_search(3, start=1)
+        G.breadth_first_search(3, start=1)
+
+        self.assertEqual([call.operation for call in calls], ['breadth_first_search'] * 2)
+        self.assertEqual(calls[0].as_dict()['nodes_expanded'], 2)
+        self.assertEqual(G.get_stats().totals()['breadth_first_search']['calls'], 2)
+
+        G.get_stats().reset()
+        self.assertEqual(G.get_stats().totals(), {})
+
+
+    def test_disable(self):
+        self.star_G.enable_stats()
+        self.star_G.disable_stats()
+
+        self.assertIsNone(self.star_G.get_stats())
+        self.assertEqual(self.star_G.__dict__.keys() & {'breadth_first_search', 'add_edges'}, set())
+        self.assertEqual(self.star_G.breadth_first_search(3, start=1), (True, [1, 0, 3]))
+
+
+    def test_stats_do_not_change_results(self):
+        G = gx.Graph(weighted=True, directed=True)
+        G.add_edges([(1, 2, 1), (2, 3, 2), (1, 3, 5), (3, 4, 1)])
+        G.add_nodes([5, 6])
+
+        views = [G, G.subgraph([1, 2, 3]), G.subgraph([5, 6]), G.edge_filtered(lambda u, v, w: w < 2),
+                 G.edge_filtered(lambda u, v, w: False), G.reverse(), G.freeze()]
+        searches = [lambda view, goal, start: view.breadth_first_search(goal, start=start),
+                    lambda view, goal, start: view.depth_first_search(goal, start=start),
+                    lambda view, goal, start: view.bidirectional_search(goal, start=start),
+                    lambda view, goal, start: view.uniform_cost_search(goal, start=start),
+                    lambda view, goal, start: view.bidirectional_dijkstra(goal, start=start, get_path=True),
+                    lambda view, goal, start: view.a_star(start, goal, get_path=True)]
+
+        def run(view, search, goal, start):
+            try:
+                return search(view, goal, start)
+            except KeyError as error:
+                return error.args
+
+        for view in views:
+            for search in searches:
+                for start, goal in ((None, 3), (1, 3), (3, 1), (5, 6), (1, 7)):
+                    expected = run(view, search, goal, start)
+
+                    view.enable_stats()
+                    self.assertEqual(run(view, search, goal, start), expected)
+                    view.disable_stats()
+
+
+if __name__ == '__main__':
+    unittest.main()
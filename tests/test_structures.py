@@ -0,0 +1,65 @@
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import unittest
+from src.structures import IndexedHeap, UnionFind
+
+
+class TestUnionFind(unittest.TestCase):
+
+    def test_union_and_find(self):
+        union_find = UnionFind(5)
+
+        self.assertTrue(union_find.union(0, 1))
+        self.assertTrue(union_find.union(3, 1))
+        self.assertFalse(union_find.union(0, 3))
+
+        self.assertTrue(union_find.connected(0, 3))
+        self.assertFalse(union_find.connected(0, 4))
+        self.assertEqual(union_find.count, 3)
+        self.assertEqual(union_find.set_size(3), 3)
+
+
+    def test_grow(self):
+        union_find = UnionFind(2)
+        union_find.union(0, 1)
+        union_find.grow(4)
+
+        self.assertEqual(len(union_find), 4)
+        self.assertEqual(union_find.count, 3)
+        self.assertEqual(union_find.find(3), 3)
+
+
+
+class TestIndexedHeap(unittest.TestCase):
+
+    def test_pops_in_priority_order(self):
+        rng = random.Random(0)
+        priorities = {key: rng.random() for key in range(100)}
+        heap = IndexedHeap()
+        for key, priority in priorities.items():
+            heap.push(key, priority)
+
+        popped = [heap.pop() for _ in range(len(priorities))]
+
+        self.assertEqual(popped, sorted(priorities.items(), key=lambda item: item[1]))
+        self.assertEqual(len(heap), 0)
+
+
+    def test_decrease_key(self):
+        heap = IndexedHeap()
+        heap.push('a', 5)
+        heap.push('b', 3)
+
+        self.assertTrue(heap.push('a', 1))
+        self.assertFalse(heap.push('b', 4))
+        self.assertEqual(heap.priority('b'), 3)
+        self.assertIn('a', heap)
+        self.assertEqual(heap.peek(), ('a', 1))
+        self.assertEqual(heap.pop(), ('a', 1))
+        self.assertNotIn('a', heap)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+import src.graphex as gx
+
+
+class TestViews(unittest.TestCase):
+
+    def setUp(self):
+        self.weighted_G = gx.Graph(weighted=True)
+        self.weighted_G.add_edges([("A", "T", "118"), ("T", "L", "111"), ("M", "L", "70"), ("M", "D", "75"), ("D", "C", "120"), ("C", "R", "146"), ("C", "P", "138"),
+                          ("R", "S", "80"), ("A", "S", "140"), ("S", "F", "99"), ("R", "P", "97"), ("P", "B", "101"), ("B", "G", "90"), ("F", "B", "211")])
+
+        self.directed_G = gx.Graph(weighted=True, directed=True)
+        self.directed_G.add_edges([(1, 2, 1), (2, 3, 1), (3, 4, 1), (1, 4, 5)])
+
+
+    def test_subgraph(self):
+        view = self.weighted_G.subgraph(["D", "C", "R", "S", "F", "B", "G"])
+
+        self.assertEqual(view.get_nodes(), ["D", "C", "R", "S", "F", "B", "G"])
+        self.assertEqual(view.get_adjacency_list("C"), [("D", 120), ("R", 146)])
+        self.assertEqual(view.uniform_cost_search(start="D", goal="B"), (True, 656))
+        self.assertEqual(view.breadth_first_search(start="D", goal="B"), (True, ["D", "C", "R", "S", "F", "B"]))
+        self.assertFalse(view.depth_first_search(start="D", goal="P", get_path=False))
+        self.assertFalse(view.has_edge(("C", "P")))
+
+        with self.assertRaises(KeyError):
+            view.get_adjacency_list("P")
+        with self.assertRaises(KeyError):
+            self.weighted_G.subgraph(["D", "Z"])
+
+
+    def test_subgraph_follows_changes(self):
+        view = self.weighted_G.subgraph(["D", "C", "P", "B"])
+        self.assertEqual(view.uniform_cost_search(start="D", goal="B"), (True, 359))
+
+        self.weighted_G.update_weight(("C", "P"), 10)
+        self.assertEqual(view.uniform_cost_search(start="D", goal="B"), (True, 231))
+
+        self.weighted_G.remove_nodes("P")
+        self.weighted_G.add_nodes("Z")   # Reuses the id of "P"
+        self.assertEqual(view.get_nodes(), ["D", "C", "B"])
+        self.assertFalse(view.is_connected("D", "B"))
+
+
+    def test_edge_filtered(self):
+        view = self.weighted_G.edge_filtered(lambda u, v, w: w < 140)
+
+        self.assertEqual(view.get_nodes(), self.weighted_G.get_nodes())
+        self.assertEqual(view.get_adjacency_list("C"), [("D", 120), ("P", 138)])
+        self.assertEqual(view.get_adjacency_list("R"), [("S", 80), ("P", 97)])
+        self.assertEqual(view.get_weight(("P", "C")), 138)
+        self.assertFalse(view.has_edge(("C", "R")))
+        self.assertEqual(view.uniform_cost_search(start="A", goal="B"), (True, 733))
+        self.assertEqual(view.breadth_first_search(start="A", goal="F"), (True, ["A", "T", "L", "M", "D", "C", "P", "R", "S", "F"]))
+
+        # Both directions of an undirected edge get the same answer
+        view = self.weighted_G.edge_filtered(lambda u, v, w: u == "C")
+        self.assertEqual(len(view.get_edges()), 2 * len(view.get_adjacency_list("C")))
+
+
+    def test_reverse(self):
+        view = self.directed_G.reverse()
+
+        self.assertEqual(view.get_adjacency_list(4), [(3, 1), (1, 5)])
+        self.assertEqual(view.predecessors(4), [])
+        self.assertEqual(view.get_weight((4, 1)), 5)
+        self.assertEqual(view.uniform_cost_search(start=4, goal=1), (True, 3))
+        self.assertEqual(view.breadth_first_search(start=4, goal=1), (True, [4, 1]))
+        self.assertFalse(view.depth_first_search(start=1, goal=4, get_path=False))
+
+        with self.assertRaises(KeyError):
+            view.get_weight((1, 4))
+
+
+    def test_nested_views_and_freeze(self):
+        view = self.directed_G.reverse().subgraph([4, 3, 2]).edge_filtered(lambda u, v, w: u != 3)
+
+        self.assertEqual(view.get_edges(), [(4, 3)])
+        self.assertEqual(self.directed_G.freeze().reverse().get_adjacency_list(2), [(1, 1)])
+
+        frozen = view.freeze()
+        self.assertEqual(frozen.get_nodes(), [4, 3, 2])
+        self.assertEqual(frozen.get_edges(), [(4, 3)])
+
+
+    def test_views_share_storage(self):
+        view = self.weighted_G.subgraph(self.weighted_G.get_nodes())
+
+        self.assertIs(view._graph, self.weighted_G)
+        self.assertEqual(set(vars(view)), {'_graph', '_weighted', '_directed', '_connectivity_state', '_nodes', '_members_state'})
+
+
+if __name__ == '__main__':
+    unittest.main()